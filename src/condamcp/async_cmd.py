@@ -15,6 +15,8 @@ The module provides the AsyncProcessRunner class for executing external commands
 and asynchronously, with comprehensive logging and monitoring capabilities. """
 import asyncio
 import aiofiles
+import concurrent.futures
+import itertools
 import logging
 import os
 import shlex
@@ -26,12 +28,45 @@ from pathlib import Path
 from typing import Callable, Optional, Union, Dict, List, Sequence, Tuple, Any
 from dataclasses import dataclass
 import psutil
-import json
+import orjson
+from .utils import get_default_shell
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Largest chunk read from a child's stdout/stderr before it is written to the log
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Finished processes are forgotten, oldest first, once more than this many are tracked
+MAX_TRACKED_PROCESSES = 256
+
+# Initial guess at bytes per line when reading the tail of a log
+LOG_TAIL_LINE_BYTES = 256
+
+# Smallest block read backwards from the end of a log for its tail
+LOG_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Bytes of stderr kept by execute() to report as the error of a failed command
+STDERR_TAIL_BYTES = 64 * 1024
+
+# Threads for blocking log reads. They are kept apart from the default executor, which
+# aiofiles uses to write the logs, so a burst of reads can't hold up the writers.
+LOG_READ_THREADS = 4
+_log_read_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=LOG_READ_THREADS, thread_name_prefix="condamcp-log-read"
+)
+
+async def run_log_read(func: Callable, *args):
+    """Run a blocking log read in the log read thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_log_read_pool, func, *args)
+
+def _append_tail(buf: bytearray, data: bytes):
+    """Append data to buf, dropping the oldest bytes beyond STDERR_TAIL_BYTES."""
+    buf += data
+    if len(buf) > STDERR_TAIL_BYTES:
+        del buf[:len(buf) - STDERR_TAIL_BYTES]
+
+@dataclass(slots=True)
 class ProcessStatus:
     """A dataclass representing the status and output of an asynchronous process.
 
@@ -49,6 +84,7 @@ class ProcessStatus:
         error (Optional[Exception]): Any exception that occurred during execution.
         log_file (Optional[Path]): Path to the log file if output logging is enabled.
         process (Optional[asyncio.subprocess.Process]): Reference to the underlying asyncio process.
+        build_id (Optional[str]): ID given to the process by AsyncCondaBuild, None for other commands.
     """
     cmd: str
     args: List[str]
@@ -59,6 +95,90 @@ class ProcessStatus:
     error: Optional[Exception] = None
     log_file: Optional[Path] = None
     process: Optional[asyncio.subprocess.Process] = None
+    build_id: Optional[str] = None
+
+def _indented_json_text(content: bytes) -> Optional[str]:
+    """Return content decoded if it looks like an object or array indented by two spaces.
+
+    This is a cheap shape check on the first line, not a full validation, and returns
+    None when the content needs to be parsed and re-serialized instead.
+    """
+    if content[:2] not in (b"{\n", b"[\n"):
+        return None
+    if content[2:4] != b"  " or content[4:5] == b" ":
+        return None
+    try:
+        return content.decode()
+    except UnicodeDecodeError:
+        return None
+
+def _read_tail(f, tail: int) -> Tuple[str, bool]:
+    """Return the last tail lines of an open binary file, and whether any earlier
+    part of the file was left out.
+
+    Blocks are read backwards from the end, each twice the size of the last, until
+    they hold more than tail line endings, so only about the tail of the file is read
+    however large it is.
+    """
+    end = f.seek(0, os.SEEK_END)
+    blocks = []
+    newlines = 0
+    block = max(tail * LOG_TAIL_LINE_BYTES, LOG_TAIL_BLOCK_SIZE)
+    # One extra line ending so a partial first line can be dropped
+    while end > 0 and newlines <= tail:
+        size = min(block, end)
+        end -= size
+        f.seek(end)
+        data = f.read(size)
+        blocks.append(data)
+        newlines += data.count(b"\n")
+        block *= 2
+    buf = b"".join(reversed(blocks))
+
+    # Only decode the lines that are returned, ignoring a final line ending
+    start = len(buf) - 1
+    for _ in range(tail):
+        start = buf.rfind(b"\n", 0, start)
+        if start < 0:
+            break
+    # Stopping at a line ending means the lines before it are cut
+    truncated = start >= 0
+    if truncated:
+        buf = buf[start + 1:]
+    return '\n'.join(buf.decode(errors='replace').splitlines()[-tail:]), truncated
+
+def _final_json_document(content: bytes) -> bytes:
+    """Drop the progress records conda writes ahead of its result with --json.
+
+    Each record is a JSON object on its own line followed by a NUL byte, so the
+    result is whatever follows the last NUL.
+    """
+    nul = content.rfind(b"\0")
+    if nul < 0:
+        return content
+    return content[nul + 1:].lstrip()
+
+def parse_progress_record(line: str) -> Optional[Dict[str, Any]]:
+    """Parse a conda --json progress record such as
+    {"fetch":"numpy","finished":false,"maxval":1,"progress":0.5}, None for any other line."""
+    line = line.strip("\0 \r\n")
+    if not line.startswith('{"fetch"'):
+        return None
+    try:
+        record = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    return record if isinstance(record, dict) and "progress" in record else None
+
+def _parse_json(content: bytes) -> Any:
+    """Parse JSON command output, raising ValueError if it isn't valid JSON."""
+    # Parse the raw bytes directly, orjson validates UTF-8 itself
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to parse command output as JSON: {e}")
+        logger.error(f"Raw log content: {content.decode(errors='replace')}")
+        raise ValueError(f"Failed to parse command output as JSON: {e}")
 
 class CommandError(Exception):
     """Raised when there's an issue with command validation"""
@@ -89,6 +209,8 @@ class AsyncProcessRunner:
         self.track_processes = track_processes
         self._active_procs: Dict[int, ProcessStatus] = {}
         self._background_tasks: List[asyncio.Task] = []
+        self._stream_tasks: Dict[int, asyncio.Task] = {}
+        self._log_seq = itertools.count()
         self._using_temp_dir = False
         
         if log_dir:
@@ -102,6 +224,29 @@ class AsyncProcessRunner:
             self.log_dir = Path(self._temp_dir_manager.name).resolve()
             self._using_temp_dir = True
             logger.info(f"Created temporary log directory at {self.log_dir}")
+        # Log file names are appended to this string rather than joined with Path's / operator
+        self._log_prefix = os.path.join(os.fspath(self.log_dir), "")
+
+    def _track_process(self, pid: int, status: ProcessStatus):
+        """Track a process, evicting the oldest finished ones past MAX_TRACKED_PROCESSES.
+
+        Running processes are never evicted, so the limit can be exceeded while more
+        than MAX_TRACKED_PROCESSES commands are running at once.
+        """
+        # Re-insert so a reused PID counts as the newest entry
+        self._active_procs.pop(pid, None)
+        self._active_procs[pid] = status
+
+        excess = len(self._active_procs) - MAX_TRACKED_PROCESSES
+        if excess <= 0:
+            return
+        for old_pid, old_status in list(self._active_procs.items()):
+            if old_status.process is None or old_status.process.returncode is not None:
+                del self._active_procs[old_pid]
+                self._stream_tasks.pop(old_pid, None)
+                excess -= 1
+                if excess == 0:
+                    break
 
     def get_active_processes(self) -> Dict[int, ProcessStatus]:
         """
@@ -131,9 +276,14 @@ class AsyncProcessRunner:
 
         status = self._active_procs[pid]
         
-        # Update return code from process if available
+        # Update return code from process if available, a forked process only counts
+        # as finished once its output has been fully written to the log
         if status.process:
-            status.return_code = status.process.returncode
+            task = self._stream_tasks.get(pid)
+            if task and not task.done():
+                status.return_code = None
+            else:
+                status.return_code = status.process.returncode
 
         # Determine status based on return code
         if status.return_code is None:
@@ -206,6 +356,23 @@ class AsyncProcessRunner:
         else:
             raise TimeoutError(f"Process {pid} did not complete within {timeout_seconds} seconds")
 
+    async def wait_process(self, status: ProcessStatus):
+        """Wait until a forked command has exited and its output is fully logged.
+
+        Unlike wait_for_command this doesn't poll or time out. Cancelling the wait
+        leaves the command and its log writer running.
+
+        Args:
+            status: The ProcessStatus returned by fork()
+        """
+        if status.process is None:
+            return
+        task = self._stream_tasks.get(status.pid)
+        if task is not None:
+            # asyncio.wait rather than awaiting the task, so cancelling us doesn't cancel it
+            await asyncio.wait((task,))
+        await status.process.wait()
+
     def get_process_log(self, pid: int, tail: Optional[int] = None) -> str:
         """Get the log output from a process.
         
@@ -221,26 +388,133 @@ class AsyncProcessRunner:
 
         status = self._active_procs[pid]
         
-        # Check if log file exists
-        if not status.log_file or not os.path.exists(status.log_file):
+        if not status.log_file:
             raise FileNotFoundError(f"Log file not found: {status.log_file}")
             
+        # Open directly rather than stat first, a missing file is reported by open()
         try:
-            with open(status.log_file) as f:
-                log_content = f.read()
-                
-            if not log_content:
-                return log_content
-                
-            if tail:
-                lines = log_content.splitlines()[-tail:]
-                return '\n'.join(lines)
-                
-            return log_content
+            with open(status.log_file, 'rb') as f:
+                if tail:
+                    return _read_tail(f, tail)[0]
+                return f.read().decode(errors='replace')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Log file not found: {status.log_file}") from None
         except Exception as e:
             logger.error(f"Error reading log file: {e}")
             return f"Error reading log file: {str(e)}"
 
+    def get_log_size(self, pid: int) -> int:
+        """Get the size in bytes of a process's log file, 0 if it has none yet."""
+        status = self._active_procs.get(pid)
+        if status is None or not status.log_file:
+            return 0
+        try:
+            return os.path.getsize(status.log_file)
+        except OSError:
+            return 0
+
+    async def read_process_log(self, pid: int, tail: Optional[int] = None) -> str:
+        """Read the log output from a process without blocking the event loop.
+
+        With tail set only the end of the file is read (see _read_tail), so asking for
+        the last lines of a large log stays cheap.
+
+        Args:
+            pid: Process ID of the command
+            tail: Optional number of lines to return from end of log
+
+        Returns:
+            str: Log content, or "Process ID not found"
+        """
+        if pid not in self._active_procs:
+            return "Process ID not found"
+        if tail:
+            return (await self.read_log_tail(pid, tail))[0]
+
+        log_file = self._active_procs[pid].log_file
+        try:
+            async with aiofiles.open(log_file, 'rb') as f:
+                return (await f.read()).decode(errors='replace')
+        except (FileNotFoundError, TypeError):
+            raise FileNotFoundError(f"Log file not found: {log_file}") from None
+
+    async def read_log_tail(self, pid: int, tail: int) -> Tuple[str, bool]:
+        """Read the last lines of a process's log without blocking the event loop.
+
+        Args:
+            pid: Process ID of the command
+            tail: Number of lines to return from end of log
+
+        Returns:
+            tuple: The lines, and whether earlier lines of the log were left out
+        """
+        if pid not in self._active_procs:
+            raise ValueError("Process ID not found")
+
+        log_file = self._active_procs[pid].log_file
+        try:
+            # One thread hop for the whole seek-and-read loop
+            return await run_log_read(self._read_log_tail, log_file, tail)
+        except (FileNotFoundError, TypeError):
+            raise FileNotFoundError(f"Log file not found: {log_file}") from None
+
+    @staticmethod
+    def _read_log_tail(log_file: Path, tail: int) -> Tuple[str, bool]:
+        """Open a log file and return its last tail lines and whether any were cut."""
+        with open(log_file, 'rb') as f:
+            return _read_tail(f, tail)
+
+    def read_log_from(self, pid: int, offset: int = 0) -> Tuple[str, int]:
+        """Read the part of a process's log written after offset.
+
+        Only complete lines are returned so callers can follow a log that is still
+        being written without splitting a line across reads.
+
+        Args:
+            pid: Process ID of the command
+            offset: Byte offset returned by the previous call, 0 to start at the beginning
+
+        Returns:
+            tuple: The new complete lines and the offset to pass to the next call
+        """
+        if pid not in self._active_procs:
+            raise ValueError("Process ID not found")
+
+        log_file = self._active_procs[pid].log_file
+        try:
+            with open(log_file, 'rb') as f:
+                f.seek(offset)
+                chunk = f.read()
+        except (FileNotFoundError, TypeError):
+            # Nothing written yet
+            return "", offset
+        end = chunk.rfind(b"\n") + 1
+        return chunk[:end].decode(errors='replace'), offset + end
+
+    def _read_log_bytes(self, pid: int) -> bytes:
+        """Read the raw contents of a process's log file.
+
+        Raises:
+            ValueError: If the process is unknown or the log file is empty
+            FileNotFoundError: If the log file for the process is not found
+            RuntimeError: If process tracking is not enabled
+        """
+        if not self.track_processes:
+            raise RuntimeError("Process tracking is not enabled")
+            
+        if pid not in self._active_procs:
+            raise ValueError("Process ID not found")
+
+        log_file = self._active_procs[pid].log_file
+        try:
+            with open(log_file, 'rb') as f:
+                log_content = f.read()
+        except (FileNotFoundError, TypeError):
+            raise FileNotFoundError(f"Log file not found: {log_file}") from None
+        if not log_content:
+            raise ValueError("Log file is empty")
+        return log_content
+
     def get_json_response(self, pid: int) -> Dict[str, Any]:
         """Load and parse the command output as JSON.
         
@@ -258,19 +532,32 @@ class AsyncProcessRunner:
             FileNotFoundError: If the log file for the process is not found
             RuntimeError: If process tracking is not enabled
         """
-        if not self.track_processes:
-            raise RuntimeError("Process tracking is not enabled")
-            
-        log_content = self.get_process_log(pid)
-        if not log_content:
-            raise ValueError("Log file is empty")
-            
-        try:
-            return json.loads(log_content)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse command output as JSON: {e}")
-            logger.error(f"Raw log content: {log_content}")
-            raise ValueError(f"Failed to parse command output as JSON: {e}")
+        return _parse_json(_final_json_document(self._read_log_bytes(pid)))
+
+    def get_json_text(self, pid: int) -> str:
+        """Get the command output as an indented JSON string.
+
+        Commands run with --json (conda in particular) already write JSON indented by
+        two spaces, in which case the log text is returned as-is without parsing it.
+        Anything else is parsed and re-serialized.
+
+        Args:
+            pid: Process ID of the command that generated JSON output
+
+        Returns:
+            str: The JSON output indented by two spaces
+
+        Raises:
+            ValueError: If the log file is empty or content cannot be parsed as JSON
+            FileNotFoundError: If the log file for the process is not found
+            RuntimeError: If process tracking is not enabled
+        """
+        log_content = _final_json_document(self._read_log_bytes(pid))
+        text = _indented_json_text(log_content)
+        if text is not None:
+            return text
+        # Parse the bytes already read rather than reading the log a second time
+        return orjson.dumps(_parse_json(log_content), option=orjson.OPT_INDENT_2).decode()
 
     def sanitize_command(self, command: str) -> str:
         """
@@ -328,7 +615,8 @@ class AsyncProcessRunner:
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_cmd_name = self._sanitize_filename(cmd_name)
-        combined_file = self.log_dir / f"{safe_cmd_name}_{timestamp}_output.log"
+        # The sequence number keeps commands started in the same second from sharing a log
+        combined_file = Path(f"{self._log_prefix}{safe_cmd_name}_{timestamp}_{next(self._log_seq)}_output.log")
         logger.debug(f"Created log file: {combined_file}")
         return combined_file
 
@@ -347,9 +635,11 @@ class AsyncProcessRunner:
         """
         if log_file:
             logger.debug(f"Starting to read {stream_name} and write to {log_file}")
-            async with aiofiles.open(log_file, 'ab') as f:
+            # Unbuffered, so each chunk is a single write in the thread pool with no flush
+            async with aiofiles.open(log_file, 'ab', buffering=0) as f:
                 while True:
-                    chunk = await stream.read()
+                    # Bounded reads so output reaches the log as it is produced
+                    chunk = await stream.read(STREAM_CHUNK_SIZE)
                     if not chunk:
                         break
                     await f.write(chunk)
@@ -361,7 +651,8 @@ class AsyncProcessRunner:
         log_file: Optional[Path],
         stream_name: str,
         status: Optional[ProcessStatus] = None,
-        status_callback: Optional[Callable[[ProcessStatus], None]] = None
+        status_callback: Optional[Callable[[ProcessStatus], None]] = None,
+        err_buf: Optional[bytearray] = None
     ) -> str:
         """
         Read from a stream and optionally write to a log file.
@@ -372,43 +663,67 @@ class AsyncProcessRunner:
             stream_name: Name of the stream ('stdout' or 'stderr') for prefixing in combined output
             status: Current process status for incremental updates
             status_callback: Callback for incremental status updates
+            err_buf: Optional buffer that collects the last STDERR_TAIL_BYTES of output
         """
         BUFFER_SIZE = 8192  # Read in 8KB chunks for better performance
+        line_ending = b"\r\n" if self.is_windows else b"\n"
+        # Fields copied into every per-line status update, looked up once
+        is_stdout = stream_name == 'stdout'
+        is_stderr = stream_name == 'stderr'
+        if status:
+            cmd, args, pid, process = status.cmd, status.args, status.pid, status.process
         
         if log_file:
             logger.debug(f"Starting to read {stream_name} and write to {log_file}")
             # Use 'wb' mode for consistent line endings across platforms
             async with aiofiles.open(log_file, 'ab') as f:
+                partial = b""
                 while True:
                     try:
                         # Read a chunk of data
-                        chunk = await stream.read(BUFFER_SIZE)
-                        if not chunk:
-                            break
+                        data = await stream.read(BUFFER_SIZE)
+                        if not data:
+                            if not partial:
+                                break
+                            # Write out a last line that had no line ending
+                            chunk, partial = partial, b""
+                        else:
+                            # Hold back an incomplete last line until the rest of it arrives
+                            chunk = partial + data
+                            end = chunk.rfind(b"\n") + 1
+                            chunk, partial = chunk[:end], chunk[end:]
+                            if not chunk:
+                                continue
                             
                         # Process the chunk line by line
                         lines = chunk.decode(errors='replace').splitlines(True)  # Keep line endings
                         
-                        # Write all lines to log file with consistent line endings
+                        # Normalize line endings into a single buffer so each chunk is one write
+                        out_buf = bytearray()
                         for line in lines:
-                            await f.write(line.rstrip().encode() + b"\r\n" if self.is_windows else b"\n")
+                            out_buf += line.rstrip().encode()
+                            out_buf += line_ending
+                        await f.write(out_buf)
+                        if err_buf is not None:
+                            _append_tail(err_buf, out_buf)
                         
                         # Only flush periodically to improve performance
-                        if len(chunk) < BUFFER_SIZE:  # Smaller chunk means less data coming
+                        if len(data) < BUFFER_SIZE:  # Short read means less data coming
                             await f.flush()
                             
                         # Send status update if callback is provided (only for non-empty lines)
                         if status and status_callback:
                             for line in lines:
-                                if line.strip():  # Only send non-empty lines to callback
+                                text = line.rstrip()
+                                if text:  # Only send non-empty lines to callback
                                     line_status = ProcessStatus(
-                                        cmd=status.cmd,
-                                        args=status.args,
-                                        pid=status.pid,
-                                        stdout=line.rstrip() if stream_name == 'stdout' else '',
-                                        stderr=line.rstrip() if stream_name == 'stderr' else '',
+                                        cmd=cmd,
+                                        args=args,
+                                        pid=pid,
+                                        stdout=text if is_stdout else '',
+                                        stderr=text if is_stderr else '',
                                         log_file=log_file,
-                                        process=status.process
+                                        process=process
                                     )
                                     status_callback(line_status)
                                     
@@ -423,6 +738,8 @@ class AsyncProcessRunner:
                     chunk = await stream.read(BUFFER_SIZE)
                     if not chunk:
                         break
+                    if err_buf is not None:
+                        _append_tail(err_buf, chunk)
                         
                     # Process chunk line by line for callbacks
                     if status and status_callback:
@@ -430,13 +747,13 @@ class AsyncProcessRunner:
                         for line in lines:
                             if line.strip():  # Skip empty lines
                                 line_status = ProcessStatus(
-                                    cmd=status.cmd,
-                                    args=status.args,
-                                    pid=status.pid,
-                                    stdout=line if stream_name == 'stdout' else '',
-                                    stderr=line if stream_name == 'stderr' else '',
+                                    cmd=cmd,
+                                    args=args,
+                                    pid=pid,
+                                    stdout=line if is_stdout else '',
+                                    stderr=line if is_stderr else '',
                                     log_file=None,
-                                    process=status.process
+                                    process=process
                                 )
                                 status_callback(line_status)
                                 
@@ -493,7 +810,6 @@ class AsyncProcessRunner:
                     log_file = self._get_log_files(cmd_name)
 
                     if use_shell:
-                        from .utils import get_default_shell
                         shell_executable = self.shell_path or get_default_shell()
                         shell_cmd = f"{sanitized_cmd} {' '.join(sanitized_args)}"
                         
@@ -531,22 +847,23 @@ class AsyncProcessRunner:
                     if status_callback:
                         status_callback(status)
                     
-                    # Read streams but don't accumulate output
+                    # Read streams, keeping only the tail of stderr for the error message
+                    err_buf = bytearray()
                     await asyncio.gather(
                         self._read_stream(process.stdout, log_file, 'stdout', status, status_callback),
-                        self._read_stream(process.stderr, log_file, 'stderr', status, status_callback)
+                        self._read_stream(process.stderr, log_file, 'stderr', status, status_callback, err_buf)
                     )
                     
                     return_code = await process.wait()
                     logger.info(f"Process {process.pid} completed with return code {return_code}")
                     
-                    # Final status with empty output strings since we don't accumulate
+                    # Final status; stdout isn't accumulated, stderr is only reported on failure
                     status = ProcessStatus(
                         cmd=sanitized_cmd,
                         args=sanitized_args,
                         pid=process.pid,
                         stdout='',
-                        stderr='',
+                        stderr=err_buf.decode("utf-8", "replace") if return_code else '',
                         return_code=return_code,
                         log_file=log_file,
                         process=process
@@ -620,21 +937,42 @@ class AsyncProcessRunner:
 
         for pid, status in list(self._active_procs.items()):
             if status.process and status.process.returncode is None:
-                try:
-                    logger.info(f"Terminating process {pid}")
-                    status.process.terminate()
-                    try:
-                        # Give it a moment to terminate gracefully
-                        await asyncio.wait_for(status.process.wait(), timeout=3)
-                    except asyncio.TimeoutError:
-                        # If still running after timeout, force kill
-                        logger.warning(f"Process {pid} did not terminate gracefully, forcing kill...")
-                        status.process.kill()
-                        await status.process.wait()
-                except ProcessLookupError:
-                    logger.debug(f"Process {pid} already terminated")
-                except Exception as e:
-                    logger.error(f"Failed to kill process {pid}: {e}")
+                await self._terminate(pid, status.process)
+
+    async def cancel_process(self, pid: int):
+        """Kill a specific process by its PID without blocking the event loop.
+
+        Like kill_process(), but the wait for a graceful exit is awaited rather
+        than blocking, and the exit is collected by asyncio itself.
+
+        Args:
+            pid: Process ID of the process to kill
+        """
+        if not self.track_processes:
+            raise RuntimeError("Process tracking is not enabled")
+        if pid not in self._active_procs:
+            raise ValueError(f"Process with PID {pid} not found in active processes")
+        process = self._active_procs[pid].process
+        if process and process.returncode is None:
+            await self._terminate(pid, process)
+
+    async def _terminate(self, pid: int, process: asyncio.subprocess.Process):
+        """Terminate a process, killing it if it hasn't exited after 3 seconds."""
+        try:
+            logger.info(f"Terminating process {pid}")
+            process.terminate()
+            try:
+                # Give it a moment to terminate gracefully
+                await asyncio.wait_for(process.wait(), timeout=3)
+            except asyncio.TimeoutError:
+                # If still running after timeout, force kill
+                logger.warning(f"Process {pid} did not terminate gracefully, forcing kill...")
+                process.kill()
+                await process.wait()
+        except ProcessLookupError:
+            logger.debug(f"Process {pid} already terminated")
+        except Exception as e:
+            logger.error(f"Failed to kill process {pid}: {e}")
 
     async def teardown(self):
         """Clean up any tracked processes and background tasks."""
@@ -684,14 +1022,13 @@ class AsyncProcessRunner:
             log_file = self._get_log_files(cmd_name)
             
             if use_shell:
-                from .utils import get_default_shell
                 shell_executable = self.shell_path or get_default_shell()
                 shell_cmd = f"{sanitized_cmd} {' '.join(sanitized_args)}"
                 
                 process = await asyncio.create_subprocess_shell(
                     shell_cmd,
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
                     env=env,
                     cwd=cwd_path if cwd else None,
                     executable=shell_executable
@@ -701,7 +1038,7 @@ class AsyncProcessRunner:
                     sanitized_cmd,
                     *sanitized_args,
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
                     env=env,
                     cwd=cwd_path if cwd else None
                 )
@@ -722,21 +1059,20 @@ class AsyncProcessRunner:
 
             # Track the process if tracking is enabled
             if self.track_processes:
-                self._active_procs[process.pid] = status
+                self._track_process(process.pid, status)
 
-            # Start background tasks to read output streams and track them
-            stdout_task = asyncio.create_task(self._fork_stream(
+            # stderr is merged into stdout by the OS, so a single task writes the log
+            # and the output keeps the order it was produced in
+            stream_task = asyncio.create_task(self._fork_stream(
                 process.stdout,
                 status.log_file,
                 'stdout'
             ))
-            stderr_task = asyncio.create_task(self._fork_stream(
-                process.stderr,
-                status.log_file,
-                'stderr'
-            ))
             
-            self._background_tasks.extend([stdout_task, stderr_task])
+            # Drop finished tasks so the list doesn't grow with every command
+            self._background_tasks = [task for task in self._background_tasks if not task.done()]
+            self._background_tasks.append(stream_task)
+            self._stream_tasks[process.pid] = stream_task
             
             return status
             
@@ -753,5 +1089,5 @@ class AsyncProcessRunner:
                 process=None
             )
             if self.track_processes:
-                self._active_procs[-1] = status
+                self._track_process(-1, status)
             return status
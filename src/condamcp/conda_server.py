@@ -1,11 +1,227 @@
 from mcp.server.fastmcp import FastMCP, Context
 from .condacmd import AsyncCondaCmd, ProcessStatus
-import json
+from .async_cmd import run_log_read
+from .utils import follow_log, notify, report_errors
 import asyncio
-from typing import Union, Tuple, Any, List, Optional, Callable, Dict
+import contextlib
+import functools
+import logging
+import os
+import time
+from typing import Tuple, Any, List, Optional, Dict, Callable, Awaitable
 
-mcp = FastMCP("Conda")
+logger = logging.getLogger(__name__)
+
+class CondaToolError(RuntimeError):
+    """Raised when a conda tool can't return a result for the request"""
+
+class _AsyncRWLock:
+    """Lets up to max_readers read-only commands run together while a writer runs alone.
+
+    Readers are bounded by a semaphore; a writer holds the write lock, which blocks
+    new readers, and waits until all in-flight readers have finished. The sides are
+    acquired and released explicitly, since a forked command holds its side until
+    the process exits, long after the tool call that started it has returned.
+    """
+    def __init__(self, max_readers: int = 4):
+        self._read_sem = asyncio.Semaphore(max_readers)
+        self._write_lock = asyncio.Lock()
+        self._readers = 0
+        self._no_readers = asyncio.Event()
+        self._no_readers.set()
+
+    async def acquire_read(self):
+        await self._read_sem.acquire()
+        try:
+            async with self._write_lock:
+                self._readers += 1
+                self._no_readers.clear()
+        except BaseException:
+            self._read_sem.release()
+            raise
+
+    def release_read(self):
+        self._readers -= 1
+        if self._readers == 0:
+            self._no_readers.set()
+        self._read_sem.release()
+
+    async def acquire_write(self):
+        await self._write_lock.acquire()
+        try:
+            await self._no_readers.wait()
+        except BaseException:
+            self._write_lock.release()
+            raise
+
+    def release_write(self):
+        self._write_lock.release()
+
+# Run `conda info --all --json` in the background at startup; set CONDAMCP_WARM_INFO=0 to skip
+_WARM_INFO = os.environ.get("CONDAMCP_WARM_INFO", "1") == "1"
+
+async def _warm_info():
+    """Run one full conda info so its package cache stat lands in the OS cache and
+    its result in the tool cache before the first real call."""
+    try:
+        await info(None, all=True, as_json=True)
+    except Exception as e:
+        logger.debug(f"Startup conda info failed: {e}")
+
+@contextlib.asynccontextmanager
+async def _lifespan(server: FastMCP):
+    task = asyncio.create_task(_warm_info()) if _WARM_INFO else None
+    try:
+        yield {}
+    finally:
+        if task is not None:
+            task.cancel()
+
+mcp = FastMCP("Conda", lifespan=_lifespan)
 async_conda = AsyncCondaCmd(track_processes=True)
+_CONDA_LOCK = _AsyncRWLock(max_readers=4)
+# Seconds a tool waits for _CONDA_LOCK before reporting that conda is busy
+CONDA_LOCK_TIMEOUT = 10
+# Tasks that release _CONDA_LOCK once their command exits, referenced until then
+_lock_release_tasks = set()
+# PIDs of the commands holding _CONDA_LOCK: pid -> whether it holds the write side
+_lock_holders: Dict[int, bool] = {}
+
+async def _fork_locked(
+    write: bool,
+    start: Callable[[], Awaitable[ProcessStatus]],
+    cache_key: Optional[tuple] = None,
+    as_json: bool = False
+) -> ProcessStatus:
+    """Start a conda command while holding the write (or read) side of _CONDA_LOCK.
+
+    The tools return as soon as the command has started, so the lock is handed to a
+    background task that releases it once the process has exited and its output is
+    logged, keeping reads from seeing an environment halfway through a change. A
+    write also clears the tool cache as it exits. With cache_key set, the output of
+    a command that completes is cached under it before the lock is released.
+
+    Raises:
+        CondaToolError: If the lock isn't free within CONDA_LOCK_TIMEOUT seconds
+    """
+    acquire = _CONDA_LOCK.acquire_write if write else _CONDA_LOCK.acquire_read
+    release = _CONDA_LOCK.release_write if write else _CONDA_LOCK.release_read
+    try:
+        await asyncio.wait_for(acquire(), CONDA_LOCK_TIMEOUT)
+    except asyncio.TimeoutError:
+        # A write waits for every holder, a read only for writers
+        busy = [pid for pid, holds_write in _lock_holders.items() if write or holds_write]
+        if busy:
+            raise CondaToolError(f"conda is busy, pid {', '.join(map(str, busy))}") from None
+        raise CondaToolError("conda is busy with another command") from None
+    try:
+        status = await start()
+    except BaseException:
+        release()
+        raise
+    _lock_holders[status.pid] = write
+
+    async def release_on_exit():
+        try:
+            await async_conda.wait_process(status)
+            if cache_key is not None and async_conda.get_process(status.pid)['status'] == 'completed':
+                _cache_put(cache_key, await _read_output(status.pid, as_json))
+        except Exception as e:
+            logger.debug(f"Caching the output of {status.pid} failed: {e}")
+        finally:
+            # Results cached before the change are stale once it has run
+            if write:
+                _cache_clear()
+            _lock_holders.pop(status.pid, None)
+            release()
+
+    task = asyncio.create_task(release_on_exit())
+    _lock_release_tasks.add(task)
+    task.add_done_callback(_lock_release_tasks.discard)
+    return status
+
+# Results of read-only tools keyed on their arguments: key -> (timestamp, result), in
+# least recently used order and bounded to TOOL_CACHE_MAX_ENTRIES
+_TOOL_CACHE: Dict[tuple, Tuple[float, Any]] = {}
+TOOL_CACHE_MAX_ENTRIES = 128
+INFO_CACHE_TTL = 30
+SEARCH_CACHE_TTL = 60
+SEARCH_CACHE_TTL_OFFLINE = 300
+
+def _cache_get(key: tuple, ttl: float) -> Any:
+    """Return a cached tool result, or None if missing or older than ttl seconds."""
+    entry = _TOOL_CACHE.get(key)
+    if entry is None:
+        return None
+    timestamp, result = entry
+    del _TOOL_CACHE[key]
+    if time.monotonic() - timestamp > ttl:
+        return None
+    # Re-insert as the most recently used entry
+    _TOOL_CACHE[key] = entry
+    return result
+
+def _cache_put(key: tuple, result: Any):
+    """Store a tool result in the cache, evicting the least recently used past the bound."""
+    _TOOL_CACHE.pop(key, None)
+    _TOOL_CACHE[key] = (time.monotonic(), result)
+    if len(_TOOL_CACHE) > TOOL_CACHE_MAX_ENTRIES:
+        del _TOOL_CACHE[next(iter(_TOOL_CACHE))]
+
+def _cache_clear():
+    """Drop all cached results, called when a command that changes installed state exits."""
+    _TOOL_CACHE.clear()
+
+# compare results are keyed on file and environment mtimes, the TTL only bounds their lifetime
+COMPARE_CACHE_TTL = 3600
+
+def _env_prefix(name: Optional[str], prefix: Optional[str]) -> Optional[str]:
+    """Resolve the prefix of an environment given by name or prefix, None if not found.
+
+    With neither set this is the active environment, as conda uses.
+    """
+    if prefix:
+        return prefix
+    if not name:
+        return os.environ.get("CONDA_PREFIX")
+    root = os.path.dirname(os.path.dirname(async_conda.binary_path))
+    if name == "base":
+        return root
+    envs_dirs = os.environ.get("CONDA_ENVS_PATH", "").split(os.pathsep)
+    for envs_dir in [d for d in envs_dirs if d] + [os.path.join(root, "envs")]:
+        path = os.path.join(envs_dir, name)
+        if os.path.isdir(path):
+            return path
+    return None
+
+def _compare_cache_key(file: str, name: Optional[str], prefix: Optional[str]) -> Optional[tuple]:
+    """Build a compare cache key from the environment file and conda-meta/history mtimes.
+
+    Returns None when either can't be found, in which case the result isn't cached.
+    """
+    env_path = _env_prefix(name, prefix)
+    if env_path is None:
+        return None
+    try:
+        file_mtime = os.stat(file).st_mtime_ns
+        env_mtime = os.stat(os.path.join(env_path, "conda-meta", "history")).st_mtime_ns
+    except OSError:
+        return None
+    return ("compare", env_path, os.path.abspath(file), file_mtime, env_mtime)
+
+# Fetch repodata.json.zst by default; set CONDAMCP_REPODATA_ZST=0 for servers that don't serve it
+_DEFAULT_ZST = os.environ.get("CONDAMCP_REPODATA_ZST", "1") == "1"
+
+def _repodata_use_zst(repodata_use_zst: Optional[bool]) -> Optional[bool]:
+    """Default an unset repodata_use_zst to True unless disabled by CONDAMCP_REPODATA_ZST."""
+    if repodata_use_zst is None and _DEFAULT_ZST:
+        return True
+    return repodata_use_zst
+
+# Fixed tool responses, formatted with % where they take a value
+_MSG_RUNNING = "Command is still running"
+_MSG_CANCELLED = "Command %d cancelled successfully"
+_MSG_CANCEL_FAILED = "Failed to cancel command %d: %s"
 
 async def wait_for_command(pid, timeout_seconds=60):
     """ Shared function for tests to use to wait for a given process to finish 
@@ -23,6 +239,27 @@ async def wait_for_command(pid, timeout_seconds=60):
     else:
         raise TimeoutError(f"Process {pid} did not complete within {timeout_seconds} seconds")
 
+# Logs larger than this are read and parsed in a worker thread
+INLINE_READ_MAX_BYTES = 256 * 1024
+
+async def _read_output(pid: int, as_json: bool = False) -> str:
+    """Read a finished command's output as JSON text or as log text.
+
+    conda's --json output is already indented, so it is passed through without a
+    parse/serialize round trip. Large logs (search --json runs to tens of MB) are
+    read in a worker thread so they don't hold the event loop; small ones are read
+    inline, which is cheaper than the thread hand-off.
+    """
+    read = async_conda.get_json_text if as_json else async_conda.get_process_log
+    if async_conda.get_log_size(pid) <= INLINE_READ_MAX_BYTES:
+        return read(pid)
+    return await run_log_read(read, pid)
+
+async def _wait_for_output(status: ProcessStatus, as_json: bool = False) -> str:
+    """Wait for a short-running command to finish and return its output."""
+    await wait_for_command(status.pid)
+    return await _read_output(status.pid, as_json)
+
 def get_command_output_as_json(pid: int) -> str:
     """Get the output of a command as JSON.
     
@@ -34,24 +271,24 @@ def get_command_output_as_json(pid: int) -> str:
     """
     status = async_conda.get_process(pid)
     if status['status'] not in ['completed', 'failed']:
-        raise Exception("Command is still running")
+        raise CondaToolError(_MSG_RUNNING)
     return async_conda.get_json_response(pid)
 
 @mcp.tool()
-def cancel_command(pid: int):
+async def cancel_command(pid: int):
     """Cancel a running conda command.
     
     Args:
         pid: Process ID of the command to cancel
     """
     try:
-        async_conda.kill_process(pid)
-        return f"Command {pid} cancelled successfully"
+        await async_conda.cancel_process(pid)
+        return _MSG_CANCELLED % pid
     except Exception as e:
-        return f"Failed to cancel command {pid}: {e}"
+        return _MSG_CANCEL_FAILED % (pid, e)
 
 @mcp.tool()
-def get_command_status(
+async def get_command_status(
     ctx: Context,
     pid: int
 ) -> ProcessStatus:
@@ -71,11 +308,11 @@ def get_command_status(
         "Check the status of my latest conda command"
         "What is the status of build 1234567890?"
     """
-    ctx.info(f"Getting status of conda command with PID {pid}...")
+    notify(ctx.info(f"Getting status of conda command with PID {pid}..."))
     return async_conda.get_process(pid)
 
 @mcp.tool()
-def get_command_output(
+async def get_command_output(
     ctx: Context,
     pid: int,
     as_json: bool = False
@@ -98,16 +335,43 @@ def get_command_output(
         "What is the output of build 1234567890?"
         "Get the output of command 1234567890 as JSON"
     """
-    ctx.info(f"Getting output of conda command with PID {pid}...")
-    # get the status of the command
-    status = get_command_status(ctx, pid)
-    # if the command is not finished, raise an exception
-    if status['status']  not in ['completed', 'failed']:
-        return "Command is still running"
-    if as_json:
-        return async_conda.get_json_response(pid)
-    else:
-        return async_conda.get_process_log(pid)
+    async with report_errors(ctx):
+        notify(ctx.info(f"Getting output of conda command with PID {pid}..."))
+        # get the status of the command, skipping the tool so only one notification is sent
+        status = async_conda.get_process(pid)
+        # if the command is not finished, raise an exception
+        if status['status']  not in ['completed', 'failed']:
+            return _MSG_RUNNING
+        return await _read_output(pid, as_json)
+
+# Lines of output kept in memory by stream_command_output for its return value
+STREAM_TAIL_LINES = 1024
+
+@mcp.tool()
+async def stream_command_output(
+    ctx: Context,
+    pid: int,
+    timeout_seconds: int = 600
+) -> str:
+    """Follow the output of a running conda command, sending new lines to the client as
+    they are written, and return the end of the output once the command finishes. Useful
+    for long installs or `run` commands where waiting for the whole log would show nothing
+    until completion.
+    
+    Args:
+        ctx: MCP context for streaming output
+        pid: Process ID of the command to follow
+        timeout_seconds: Maximum time to follow the command in seconds (default: 600)
+
+    Returns:
+        The last lines of the command's output (up to STREAM_TAIL_LINES).
+
+    Examples:
+        "Show me the install output as it happens"
+        "Follow the output of command 1234567890"
+    """
+    async with report_errors(ctx):
+        return await follow_log(ctx, async_conda, pid, timeout_seconds, STREAM_TAIL_LINES)
 
 @mcp.tool()
 async def list_environments(
@@ -131,12 +395,9 @@ async def list_environments(
         "List all conda environments"
         "Show available environments as JSON"
     """
-    status = await async_conda.env("list", as_json=as_json)
-    await wait_for_command(status.pid)
-    if as_json:
-        return async_conda.get_json_response(status.pid)
-    else:
-        return async_conda.get_process_log(status.pid)
+    async with report_errors(ctx):
+        status = await _fork_locked(False, functools.partial(async_conda.env, "list", as_json=as_json))
+        return await _wait_for_output(status, as_json)
 
 @mcp.tool()
 async def create(
@@ -193,45 +454,13 @@ async def create(
         "Clone existing environment 'base' to 'newenv'"
         "Create environment with specific python version"
     """
+
+    # Forward every tool argument except ctx; the signature stays explicit for the tool schema
+    kwargs = dict(locals())
+    del kwargs["ctx"]
         
-        # Run the conda create command
-    status = await async_conda.create(
-        name=name,
-        prefix=prefix,
-        packages=packages,
-        clone=clone,
-        file=file,
-        channels=channels,
-        use_local=use_local,
-        override_channels=override_channels,
-        repodata_fn=repodata_fn,
-        experimental=experimental,
-        no_lock=no_lock,
-        repodata_use_zst=repodata_use_zst,
-        strict_channel_priority=strict_channel_priority,
-        no_channel_priority=no_channel_priority,
-        no_deps=no_deps,
-        only_deps=only_deps,
-        no_pin=no_pin,
-        no_default_packages=no_default_packages,
-        copy=copy,
-        no_shortcuts=no_shortcuts,
-        shortcuts_only=shortcuts_only,
-        use_index_cache=use_index_cache,
-        insecure=insecure,
-        offline=offline,
-        solver=solver,
-        dry_run=dry_run,
-        yes=yes,
-        quiet=quiet,
-        as_json=as_json,
-        verbose=verbose,
-        console=console,
-        download_only=download_only,
-        show_channel_urls=show_channel_urls,
-        subdir=subdir,
-        dev=dev
-        )
+    # Run the conda create command
+    status = await _fork_locked(True, functools.partial(async_conda.create, **kwargs))
         
     return status
 
@@ -281,35 +510,12 @@ async def remove(
         "Remove all packages but keep the environment"
     """
 
+    # Forward every tool argument except ctx; the signature stays explicit for the tool schema
+    kwargs = dict(locals())
+    del kwargs["ctx"]
+
     # Run the conda remove command
-    status = await async_conda.remove(
-        name=name,
-        prefix=prefix,
-        packages=packages,
-        all=all,
-        keep_env=keep_env,
-        channels=channels,
-        use_local=use_local,
-        override_channels=override_channels,
-        repodata_fn=repodata_fn,
-        experimental=experimental,
-        no_lock=no_lock,
-        repodata_use_zst=repodata_use_zst,
-        features=features,
-        force_remove=force_remove,
-        no_pin=no_pin,
-        solver=solver,
-        use_index_cache=use_index_cache,
-        insecure=insecure,
-        offline=offline,
-        dry_run=dry_run,
-        yes=yes,
-        quiet=quiet,
-        as_json=as_json,
-        verbose=verbose,
-        console=console,
-        dev=dev
-        )
+    status = await _fork_locked(True, functools.partial(async_conda.remove, **kwargs))
         
     return status
 
@@ -334,9 +540,7 @@ async def help(command: Optional[str] = None) -> str:
     """
     
     status = await async_conda.help(command)
-    await wait_for_command(status.pid)
-    response = async_conda.get_process_log(status.pid)
-    return response
+    return await _wait_for_output(status)
 
 
 @mcp.tool()
@@ -377,26 +581,12 @@ async def list(
         "Show installed packages with their channels"
         "List with explicit URLs and SHA256 hashes"
     """
+
+    # Forward every tool argument except ctx; the signature stays explicit for the tool schema
+    kwargs = dict(locals())
+    del kwargs["ctx"]
   
-    status = await async_conda.list(
-        name=name,
-        prefix=prefix,
-        regex=regex,
-        show_channel_urls=show_channel_urls,
-        reverse=reverse,
-        canonical=canonical,
-        full_name=full_name,
-        explicit=explicit,
-        md5=md5,
-        sha256=sha256,
-        export=export,
-        revisions=revisions,
-        no_pip=no_pip,
-        auth=auth,
-        as_json=as_json,
-        verbose=verbose,
-        quiet=quiet,
-        )
+    status = await _fork_locked(False, functools.partial(async_conda.list, **kwargs))
         
     return status
 
@@ -432,7 +622,9 @@ async def clean(
         "Clean index cache and packages"
     """
 
-    status = await async_conda.clean(
+    # Removing cached packages can race an install that is linking them
+    status = await _fork_locked(True, functools.partial(
+        async_conda.clean,
         all=all,
         index_cache=index_cache,
         packages=packages,
@@ -446,7 +638,7 @@ async def clean(
         as_json=as_json,
         verbose=verbose,
         console=console,
-        )
+    ))
     return status
 
 @mcp.tool()
@@ -465,7 +657,8 @@ async def compare(
 
     Returns:
         ProcessStatus for tracking the command's execution, use get_command_status 
-        to get the status of a running command.
+        to get the status of a running command. If the environment and file haven't
+        changed since an earlier identical compare completed, its output instead.
 
 
     Examples:
@@ -474,10 +667,17 @@ async def compare(
         "Compare environment myenv with path/to/environment.yml"
         "Show detailed comparison with environment.yml"
     """
+    # Unchanged environment and file give the same result, so return the earlier output
+    cache_key = _compare_cache_key(file, name, prefix)
+    if cache_key is not None:
+        cache_key += (verbose, quiet, as_json, console)
+        cached = _cache_get(cache_key, COMPARE_CACHE_TTL)
+        if cached is not None:
+            return cached
 
-        
     # Run the conda compare command
-    status = await async_conda.compare(
+    status = await _fork_locked(False, functools.partial(
+        async_conda.compare,
         file=file,
         name=name,
         prefix=prefix,
@@ -485,7 +685,7 @@ async def compare(
         quiet=quiet,
         as_json=as_json,
         console=console,
-        )
+    ), cache_key, as_json)
     
     return status
 
@@ -516,8 +716,14 @@ async def info(
         "Display system environment variables"
     """
 
+    cache_key = ("info", all, base, envs, system, unsafe_channels, verbose, as_json)
+    cached = _cache_get(cache_key, INFO_CACHE_TTL)
+    if cached is not None:
+        return cached
+
     # Run the conda info command
-    status = await async_conda.info(
+    status = await _fork_locked(False, functools.partial(
+        async_conda.info,
         all=all,
         base=base,
         envs=envs,
@@ -526,14 +732,13 @@ async def info(
         verbose=verbose,
         quiet=quiet,
         as_json=as_json,
-        )
-    
+    ))
+
     # Since info is short-running, we can wait for the process to finish
-    await wait_for_command(status.pid)
-    if as_json:
-        return async_conda.get_json_response(status.pid)
-    else:
-        return async_conda.get_process_log(status.pid)
+    result = await _wait_for_output(status, as_json)
+    if async_conda.get_process(status.pid)['status'] == 'completed':
+        _cache_put(cache_key, result)
+    return result
 
 @mcp.tool()
 async def search(
@@ -565,31 +770,36 @@ async def search(
         ProcessStatus for tracking the command's execution, use get_command_status 
         to get the status of a running command.
 
+    Compressed repodata (repodata.json.zst) is used unless repodata_use_zst is set to False.
+    An identical search that completed recently returns its output
+    rather than a new ProcessStatus.
+
     Examples:
         "Search for scipy in conda-forge channel"
+        "Search for numpy without using compressed repodata" (repodata_use_zst=False)
     """
-        
-        # Run the conda search command
-    status = await async_conda.search(
-        query=query,
-        envs=envs,
-        info=info,
-        subdir=subdir,
-        skip_flexible_search=skip_flexible_search,
-        channels=channels,
-        use_local=use_local,
-        override_channels=override_channels,
-        repodata_fn=repodata_fn,
-        experimental=experimental,
-        no_lock=no_lock,
-        repodata_use_zst=repodata_use_zst,
-        insecure=insecure,
-        offline=offline,
-        verbose=verbose,
-        quiet=quiet,
-        as_json=as_json,
-        use_index_cache=use_index_cache
+
+    # Forward every tool argument except ctx; the signature stays explicit for the tool schema
+    kwargs = dict(locals())
+    del kwargs["ctx"]
+    kwargs["repodata_use_zst"] = _repodata_use_zst(repodata_use_zst)
+    # Identical searches within the TTL return the earlier output instead of forking conda again
+    cache_key = None
+    if not no_lock:
+        cache_key = (
+            "search", query, envs, info, subdir, skip_flexible_search, tuple(channels or ()),
+            use_local, override_channels, tuple(repodata_fn or ()), experimental,
+            kwargs["repodata_use_zst"], insecure, offline, verbose, quiet, as_json, use_index_cache
         )
+        ttl = SEARCH_CACHE_TTL_OFFLINE if offline or use_index_cache else SEARCH_CACHE_TTL
+        cached = _cache_get(cache_key, ttl)
+        if cached is not None:
+            return cached
+
+    # Run the conda search command
+    status = await _fork_locked(
+        False, functools.partial(async_conda.search, **kwargs), cache_key, as_json
+    )
 
     return status
 
@@ -618,7 +828,8 @@ async def run(
         "Run jupyter notebook in data-science-env"
     """
 
-    # Run the conda run command
+    # Run the conda run command, without _CONDA_LOCK: it runs arbitrary programs (servers,
+    # notebooks) for as long as they like and doesn't change the environment through conda
     status = await async_conda.run(
         executable_call=executable_call,
         name=name,
@@ -661,7 +872,8 @@ async def export(
     """
 
     # Run the conda export command
-    status = await async_conda.export(
+    status = await _fork_locked(False, functools.partial(
+        async_conda.export,
         name=name,
         prefix=prefix,
         file=file,
@@ -674,7 +886,7 @@ async def export(
         console=console,
         verbose=verbose,
         quiet=quiet,
-    )   
+    ))
 
     return status
 
@@ -730,54 +942,23 @@ async def install(
         process ID, output / log file, return code and other relevant information for tracking
         the command's execution.
 
+    Compressed repodata (repodata.json.zst) is used unless repodata_use_zst is set to False.
+    An identical search that completed recently returns its output
+    rather than a new ProcessStatus.
+
     Examples:
         "Install scipy in current environment"
         "Install packages in specific environment"
         "Install specific version of python"
+        "Install numpy without using compressed repodata" (repodata_use_zst=False)
     """        
+
+    # Forward every tool argument except ctx; the signature stays explicit for the tool schema
+    kwargs = dict(locals())
+    del kwargs["ctx"]
+    kwargs["repodata_use_zst"] = _repodata_use_zst(repodata_use_zst)
     # Run the conda install command
-    status = await async_conda.install(
-        name=name,
-        prefix=prefix,
-        packages=packages,
-        revision=revision,
-        file=file,
-        channels=channels,
-        use_local=use_local,
-        override_channels=override_channels,
-        repodata_fn=repodata_fn,
-        experimental=experimental,
-        no_lock=no_lock,
-        repodata_use_zst=repodata_use_zst,
-        strict_channel_priority=strict_channel_priority,
-        no_channel_priority=no_channel_priority,
-        no_deps=no_deps,
-        only_deps=only_deps,
-        no_pin=no_pin,
-        solver=solver,
-        force_reinstall=force_reinstall,
-        freeze_installed=freeze_installed,
-        update_deps=update_deps,
-        satisfied_skip_solve=satisfied_skip_solve,
-        update_all=update_all,
-        update_specs=update_specs,
-        copy=copy,
-        no_shortcuts=no_shortcuts,
-        shortcuts_only=shortcuts_only,
-        clobber=clobber,
-        use_index_cache=use_index_cache,
-        insecure=insecure,
-        offline=offline,
-        dry_run=dry_run,
-        yes=yes,
-        quiet=quiet,
-        as_json=as_json,
-        verbose=verbose,
-        console=console,
-        download_only=download_only,
-        show_channel_urls=show_channel_urls,
-        dev=dev,
-    )
+    status = await _fork_locked(True, functools.partial(async_conda.install, **kwargs))
         
     return status
 
@@ -829,53 +1010,25 @@ async def upgrade(
         to get the status of a running command.
 
 
+    Compressed repodata (repodata.json.zst) is used unless repodata_use_zst is set to False.
+    An identical search that completed recently returns its output
+    rather than a new ProcessStatus.
+
     Examples:
         "Update scipy in current environment"
         "Update all packages in environment myenv"
         "Update packages from requirements.txt"
         "Update with specific channel priority"
+        "Update pip without using compressed repodata" (repodata_use_zst=False)
     """
    
-     # Run the conda upgrade command
-    status = await async_conda.upgrade(
-        packages=packages,
-        name=name,
-        prefix=prefix,
-        channels=channels,
-        use_local=use_local,
-        override_channels=override_channels,
-        repodata_fn=repodata_fn,
-        experimental=experimental,
-        no_lock=no_lock,
-        repodata_use_zst=repodata_use_zst,
-        strict_channel_priority=strict_channel_priority,
-        no_channel_priority=no_channel_priority,
-        no_deps=no_deps,
-        only_deps=only_deps,
-        no_pin=no_pin,
-        solver=solver,
-        force_reinstall=force_reinstall,
-        freeze_installed=freeze_installed,
-        update_deps=update_deps,
-        satisfied_skip_solve=satisfied_skip_solve,
-        update_all=update_all,
-        update_specs=update_specs,
-        copy=copy,
-        no_shortcuts=no_shortcuts,
-        shortcuts_only=shortcuts_only,
-        clobber=clobber,
-        use_index_cache=use_index_cache,
-        insecure=insecure,
-        offline=offline,
-        dry_run=dry_run,
-        yes=yes,
-        quiet=quiet,
-        as_json=as_json,
-        verbose=verbose,
-        console=console,
-        download_only=download_only,
-        file=file
-    )
+    # Forward every tool argument except ctx; the signature stays explicit for the tool schema
+    kwargs = dict(locals())
+    del kwargs["ctx"]
+    kwargs["repodata_use_zst"] = _repodata_use_zst(repodata_use_zst)
+
+    # Run the conda upgrade command
+    status = await _fork_locked(True, functools.partial(async_conda.upgrade, **kwargs))
     
     return status
 
@@ -901,22 +1054,25 @@ async def env(
         ProcessStatus for tracking the command's execution, use get_command_status 
         to get the status of a running command.
     """
-
-    status = await async_conda.env(
-        command=command,
-        name=name,
-        prefix=prefix,
-        packages=packages,
-        channels=channels,
-        override_channels=override_channels,
-        use_local=use_local,
-        as_json=as_json,
-        quiet=quiet,
-        verbose=verbose,
-        offline=offline
-    )
-    
-    return status
+    async with report_errors(ctx):
+        # Every subcommand but list and export changes an environment or its config
+        mutating = command not in ("list", "export")
+        status = await _fork_locked(mutating, functools.partial(
+            async_conda.env,
+            command=command,
+            name=name,
+            prefix=prefix,
+            packages=packages,
+            channels=channels,
+            override_channels=override_channels,
+            use_local=use_local,
+            as_json=as_json,
+            quiet=quiet,
+            verbose=verbose,
+            offline=offline,
+        ))
+
+        return status
 
 def run_conda_server():
     """Entry point for the conda environment MCP server"""
@@ -3,14 +3,283 @@
 Conda build command wrapper that uses AsyncProcessRunner to build and execute conda build commands.
 """
 
+import asyncio
+import dataclasses
+import hashlib
+import itertools
 import os
+import re
+import shutil
+import tempfile
 import time
+import orjson
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional, List, Dict, Union, Any
-from .async_cmd import ProcessStatus
+from typing import Callable, Optional, List, Dict, Set, Tuple, Union, Any
+from .async_cmd import MAX_TRACKED_PROCESSES, ProcessStatus, run_log_read
 from .condacmd import AsyncCondaCmd
 
+# conda build options as (parameter, flag, kind), in command line order. Kinds:
+#   bool: flag only, when true
+#   value: flag and the value, when set
+#   number: flag and str(value), when not None (0 is a valid value)
+#   multi: flag and value repeated for each item of a list (CondaBuildSpec turns a string into a list)
+#   mapping: flag and key=value repeated for each item of a dict
+_BUILD_FLAGS = (
+    # Config options
+    ("config_file", "--config-file", "value"),
+    ("croot", "--croot", "value"),
+    ("channels", "-c", "multi"),
+    ("variant_config_files", "--variant-config-file", "multi"),
+    ("exclusive_config_files", "--exclusive-config-file", "multi"),
+    # Version specifications
+    ("python_version", "--python", "value"),
+    ("perl", "--perl", "value"),
+    ("numpy", "--numpy", "value"),
+    ("r_base", "--R", "value"),
+    ("lua", "--lua", "value"),
+    # Build options
+    ("bootstrap", "--bootstrap", "value"),
+    ("append_file", "--append-file", "value"),
+    ("clobber_file", "--clobber-file", "value"),
+    ("old_build_string", "--old-build-string", "bool"),
+    ("use_channeldata", "--use-channeldata", "bool"),
+    ("variants", "--variants", "value"),
+    ("check", "--check", "bool"),
+    ("no_include_recipe", "--no-include-recipe", "bool"),
+    ("source", "--source", "bool"),
+    ("test", "--test", "bool"),
+    ("no_test", "--no-test", "bool"),
+    ("build_only", "--build-only", "bool"),
+    ("post", "--post", "bool"),
+    ("test_run_post", "--test-run-post", "bool"),
+    ("skip_existing", "--skip-existing", "bool"),
+    ("keep_old_work", "--keep-old-work", "bool"),
+    ("dirty", "--dirty", "bool"),
+    ("debug", "--debug", "bool"),
+    # Upload options
+    ("token", "--token", "value"),
+    ("user", "--user", "value"),
+    ("label", "--label", "value"),
+    ("no_force_upload", "--no-force-upload", "bool"),
+    ("zstd_compression_level", "--zstd-compression-level", "number"),
+    ("password", "--password", "value"),
+    ("sign", "--sign", "value"),
+    ("sign_with", "--sign-with", "value"),
+    ("identity", "--identity", "value"),
+    ("repository", "--repository", "value"),
+    # Environment options
+    ("no_activate", "--no-activate", "bool"),
+    ("no_build_id", "--no-build-id", "bool"),
+    ("build_id_pat", "--build-id-pat", "value"),
+    # Verification options
+    ("verify", "--verify", "bool"),
+    ("no_verify", "--no-verify", "bool"),
+    ("strict_verify", "--strict-verify", "bool"),
+    # Output options
+    ("output_folder", "--output-folder", "value"),
+    ("no_prefix_length_fallback", "--no-prefix-length-fallback", "bool"),
+    ("prefix_length_fallback", "--prefix-length-fallback", "bool"),
+    ("prefix_length", "--prefix-length", "number"),
+    # Locking and work directory options
+    ("no_locking", "--no-locking", "bool"),
+    ("no_remove_work_dir", "--no-remove-work-dir", "bool"),
+    # Error handling options
+    ("error_overlinking", "--error-overlinking", "bool"),
+    ("no_error_overlinking", "--no-error-overlinking", "bool"),
+    ("error_overdepending", "--error-overdepending", "bool"),
+    ("no_error_overdepending", "--no-error-overdepending", "bool"),
+    # Test prefix options
+    ("long_test_prefix", "--long-test-prefix", "bool"),
+    ("no_long_test_prefix", "--no-long-test-prefix", "bool"),
+    # Build behavior options
+    ("keep_going", "--keep-going", "bool"),
+    ("cache_dir", "--cache-dir", "value"),
+    ("no_copy_test_source_files", "--no-copy-test-source-files", "bool"),
+    ("merge_build_host", "--merge-build-host", "bool"),
+    ("stats_file", "--stats-file", "value"),
+    # Extra dependencies and metadata
+    ("extra_deps", "--extra-deps", "multi"),
+    ("extra_meta", "--extra-meta", "mapping"),
+    # Channel options
+    ("suppress_variables", "--suppress-variables", "bool"),
+    ("use_local", "--use-local", "bool"),
+    ("override_channels", "--override-channels", "bool"),
+    ("repodata_fn", "--repodata-fn", "multi"),
+    # Experimental options
+    ("experimental", "--experimental", "value"),
+    ("no_lock", "--no-lock", "bool"),
+)
+
+_MULTI_FLAG_NAMES = tuple(name for name, _, kind in _BUILD_FLAGS if kind == "multi")
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CondaBuildSpec:
+    """Options for one conda build, the same as the keyword arguments of
+    AsyncCondaBuild.build(). See that method for what each option does."""
+    recipe_path: str
+    build_env: str
+    config_file: Optional[str] = None
+    croot: Optional[str] = None
+    channels: Optional[Union[str, List[str]]] = None
+    variant_config_files: Optional[List[str]] = None
+    exclusive_config_files: Optional[List[str]] = None
+    python_version: Optional[str] = None
+    perl: Optional[str] = None
+    numpy: Optional[str] = None
+    r_base: Optional[str] = None
+    lua: Optional[str] = None
+    bootstrap: Optional[str] = None
+    append_file: Optional[str] = None
+    clobber_file: Optional[str] = None
+    old_build_string: bool = False
+    use_channeldata: bool = False
+    variants: Optional[str] = None
+    check: bool = False
+    no_include_recipe: bool = False
+    source: bool = False
+    test: bool = False
+    no_test: bool = False
+    build_only: bool = False
+    post: bool = False
+    test_run_post: bool = False
+    skip_existing: bool = False
+    keep_old_work: bool = False
+    dirty: bool = False
+    debug: bool = False
+    token: Optional[str] = None
+    user: Optional[str] = None
+    label: Optional[str] = None
+    no_force_upload: bool = False
+    zstd_compression_level: Optional[int] = None
+    password: Optional[str] = None
+    sign: Optional[str] = None
+    sign_with: Optional[str] = None
+    identity: Optional[str] = None
+    repository: Optional[str] = None
+    no_activate: bool = False
+    no_build_id: bool = False
+    build_id_pat: Optional[str] = None
+    verify: bool = False
+    no_verify: bool = False
+    strict_verify: bool = False
+    output_folder: Optional[str] = None
+    no_prefix_length_fallback: bool = False
+    prefix_length_fallback: bool = False
+    prefix_length: Optional[int] = None
+    no_locking: bool = False
+    no_remove_work_dir: bool = False
+    error_overlinking: bool = False
+    no_error_overlinking: bool = False
+    error_overdepending: bool = False
+    no_error_overdepending: bool = False
+    long_test_prefix: bool = False
+    no_long_test_prefix: bool = False
+    keep_going: bool = False
+    cache_dir: Optional[str] = None
+    no_copy_test_source_files: bool = False
+    merge_build_host: bool = False
+    stats_file: Optional[str] = None
+    extra_deps: Optional[List[str]] = None
+    extra_meta: Optional[Dict[str, str]] = None
+    suppress_variables: bool = False
+    use_local: bool = False
+    override_channels: bool = False
+    repodata_fn: Optional[List[str]] = None
+    experimental: Optional[str] = None
+    no_lock: bool = False
+    repodata_use_zst: Optional[bool] = None
+    quiet: bool = False
+    fast_build: bool = False
+    cache_results: bool = False
+
+    def __post_init__(self):
+        # Accept a single string for list options, so the flag loop needn't check each time
+        for name in _MULTI_FLAG_NAMES:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, [value])
+
+    @classmethod
+    def from_options(cls, options: Dict[str, Any]) -> "CondaBuildSpec":
+        """Create a spec from a mapping with a value for every field, e.g. the locals() of
+        a function taking the build options as keyword arguments."""
+        return cls(**{name: options[name] for name in _SPEC_FIELDS})
+
+# Field names of CondaBuildSpec, looked up once rather than on every build
+_SPEC_FIELDS = tuple(field.name for field in dataclasses.fields(CondaBuildSpec))
+
+# Keyword arguments accepted by AsyncCondaBuild.build()
+_BUILD_KWARGS = frozenset(_SPEC_FIELDS) | {"env", "status_callback"}
+
+# Options that contradict each other, checked before any conda process is started
+_EXCLUSIVE_FLAGS = (
+    ("test", "no_test"),
+    ("verify", "no_verify"),
+    ("verify", "strict_verify"),
+    ("prefix_length_fallback", "no_prefix_length_fallback"),
+    ("error_overlinking", "no_error_overlinking"),
+    ("error_overdepending", "no_error_overdepending"),
+    ("long_test_prefix", "no_long_test_prefix"),
+    ("use_local", "override_channels"),
+)
+
+# Options applied by fast_build, each with the option that overrides it when the
+# caller sets it explicitly. Skipping tests and verification and compressing at
+# zstd level 1 avoids the slowest single-threaded steps at the end of a build.
+_FAST_BUILD_OPTIONS = (
+    ("no_test", True, "test"),
+    ("no_verify", True, "verify"),
+    ("no_error_overlinking", True, "error_overlinking"),
+    ("no_long_test_prefix", True, "long_test_prefix"),
+    ("zstd_compression_level", 1, "zstd_compression_level"),
+)
+
+def _apply_fast_build(spec: CondaBuildSpec) -> CondaBuildSpec:
+    """Return spec with the _FAST_BUILD_OPTIONS the caller didn't give themselves.
+
+    Flags are unset at False and value options at None, so an explicit 0 (e.g.
+    zstd_compression_level=0) counts as given.
+    """
+    def given(option):
+        value = getattr(spec, option)
+        return value is not None and value is not False
+
+    return dataclasses.replace(spec, **{
+        name: value for name, value, override in _FAST_BUILD_OPTIONS
+        if not given(override) and not given(name)
+    })
+
+# Seconds that the environment names read by _validate_build_env are reused
+ENV_CACHE_TTL = 5
+
+# Bytes of build log kept by read_process_log across all builds, a larger log is read
+# from disk on every call
+LOG_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Directory in the log directory where cache_results keeps the packages of successful builds
+BUILD_CACHE_DIR = ".build_cache"
+
+# Package paths in a build log, e.g. in the `anaconda upload` hint printed at the end:
+# absolute POSIX paths or Windows paths with a drive letter, without spaces
+_PACKAGE_PATH_RE = re.compile(
+    rb"(?:^|\s)((?:/|[A-Za-z]:[\\/])\S+\.(?:conda|tar\.bz2))\s*$", re.MULTILINE
+)
+
 class AsyncCondaBuild(AsyncCondaCmd):
+    # Appended to every build command
+    DEFAULT_ARGS = (
+        "--no-anaconda-upload",
+        "--error-overlinking"
+    )
+    # Arguments around the build environment name when building with conda run
+    CONDA_RUN_ARGS = ("run", "-n")
+    BUILD_ARGS = ("conda", "build")
+    # Numbers build IDs, unique however many builds start at once
+    _build_counter = itertools.count()
+    # Stand-in PIDs for builds answered from the result cache, never a real process
+    _cached_pids = itertools.count(-2, -1)
+
     def __init__(self, log_dir: Optional[str] = None, *args, **kwargs):
         """Initialize async conda build wrapper with default settings.
         
@@ -20,46 +289,104 @@ class AsyncCondaBuild(AsyncCondaCmd):
             **kwargs: Additional keyword arguments passed to AsyncCondaCmd
         """
         super().__init__(log_dir=log_dir, *args, **kwargs)
-        self.default_args = [
-            "--no-anaconda-upload",
-            "--error-overlinking"
-        ]
-
-    async def _validate_build_env(self, build_env: str) -> str:
+        # Full build logs already read, least recently read first, keyed on PID:
+        # (mtime_ns, size, text, offset and length in text of the complete lines)
+        self._log_cache: Dict[int, Tuple[int, int, str, int, int]] = {}
+        # PIDs of started builds, keyed on build_id
+        self._build_pids: Dict[str, int] = {}
+        # Environment names used to validate build_env: (timestamp, names)
+        self._env_cache: Optional[Tuple[float, Set[str]]] = None
+        # Environments created by this conda installation live here
+        self._envs_dir = os.path.join(os.path.dirname(os.path.dirname(self.binary_path)), "envs")
+
+    async def _validate_build_env(self, build_env: str):
         """Validate that the build environment exists.
+
+        An environment in the installation's envs directory is found with a single
+        stat. Other names come from conda's environments.txt, reused for
+        ENV_CACHE_TTL seconds, falling back to `conda env list` without it.
         
         Args:
             build_env: Name of conda environment containing conda-build
         """
-        status = await self.env("list", as_json=True)
-        await self.wait_for_command(status.pid)
-        env_list = self.get_json_response(status.pid)
-        if build_env not in env_list:
+        if build_env and os.sep not in build_env and os.path.isdir(
+            os.path.join(self._envs_dir, build_env, "conda-meta")
+        ):
+            return
+
+        now = time.monotonic()
+        if self._env_cache is None or now - self._env_cache[0] > ENV_CACHE_TTL:
+            names = await asyncio.to_thread(self._read_env_names)
+            if names is None:
+                # No environments.txt, ask conda
+                status = await self.env("list", as_json=True)
+                await self.wait_for_command(status.pid)
+                env_paths = self.get_json_response(status.pid).get("envs", [])
+                names = {Path(path).name for path in env_paths}
+                names.add("base")
+            self._env_cache = (now, names)
+
+        if build_env not in self._env_cache[1]:
             raise ValueError(f"Build environment {build_env} not found")
 
-    def _validate_paths(self, recipe_path: str, config_file: Optional[str] = None, croot: Optional[str] = None) -> List[str]:
+    def _read_env_names(self) -> Optional[Set[str]]:
+        """Collect environment names from ~/.conda/environments.txt and the envs directory
+        next to the conda binary, None if environments.txt doesn't exist."""
+        try:
+            with open(Path("~/.conda/environments.txt").expanduser()) as f:
+                names = {Path(line.strip()).name for line in f if line.strip()}
+        except FileNotFoundError:
+            return None
+
+        names.add("base")
+        try:
+            with os.scandir(self._envs_dir) as entries:
+                names.update(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            pass
+        return names
+
+    def refresh_env_cache(self):
+        """Forget the cached environment names, e.g. after creating a build environment."""
+        self._env_cache = None
+
+    async def _validate_paths(self, recipe_path: str, config_file: Optional[str] = None, croot: Optional[str] = None) -> Tuple[List[str], Dict[str, str]]:
         """Validate that all required paths exist.
 
+        Each path is checked with a single stat call, and the checks run concurrently
+        in worker threads since stat calls on network filesystems can be slow.
+
         Args:
             recipe_path: Path to recipe directory
             config_file: Path to conda build config file
             croot: Build root directory
 
         Returns:
-            list: List of error messages, empty if all paths are valid
+            tuple: List of error messages, empty if all paths are valid, and the checked
+            paths keyed by 'Recipe', 'Config' and 'Build root'
         """
-        errors = []
         paths_to_check = {
-            'Recipe': Path(recipe_path),
-            'Config': Path(config_file) if config_file else None,
-            'Build root': Path(croot) if croot else None
+            name: path
+            for name, path in (('Recipe', recipe_path), ('Config', config_file), ('Build root', croot))
+            if path
         }
 
-        for name, path in paths_to_check.items():
-            if path is not None and not path.exists():
-                errors.append(f"{name} path does not exist: {path}")
+        exists = await asyncio.gather(*(asyncio.to_thread(self._path_exists, path) for path in paths_to_check.values()))
+        errors = [
+            f"{name} path does not exist: {path}"
+            for (name, path), found in zip(paths_to_check.items(), exists)
+            if not found
+        ]
+        return errors, paths_to_check
 
-        return errors
+    @staticmethod
+    def _path_exists(path: str) -> bool:
+        """Check a path with one os.stat call, without building a Path object."""
+        try:
+            os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return True
 
     async def build(
         self,
@@ -137,6 +464,8 @@ class AsyncCondaBuild(AsyncCondaCmd):
         repodata_use_zst: Optional[bool] = None,
         env: Optional[Dict[str, str]] = None,
         quiet: bool = False,
+        fast_build: bool = False,
+        cache_results: bool = False,
         status_callback: Optional[Callable[[ProcessStatus], None]] = None
     ) -> ProcessStatus:
         """Build a conda package using conda-build.
@@ -213,230 +542,335 @@ class AsyncCondaBuild(AsyncCondaCmd):
             experimental: Enable experimental features
             no_lock: Disable locking
             repodata_use_zst: Use zst repodata
-            env: Environment variables
+            env: Environment variables to set for the build, on top of the current environment
             quiet: Quiet output
+            fast_build: Skip tests, verification and the overlinking check, and use zstd
+                level 1, unless the corresponding options are given explicitly
+            cache_results: Reuse the packages of an earlier successful build with the same
+                recipe files, config file and options instead of building again
             status_callback: Callback for process status updates
 
         Returns:
             ProcessStatus: Process status object
         """
+        spec = CondaBuildSpec.from_options(locals())
+        return await self.build_from_spec(spec, env=env, status_callback=status_callback)
+
+    async def build_from_spec(
+        self,
+        spec: CondaBuildSpec,
+        *,
+        env: Optional[Dict[str, str]] = None,
+        status_callback: Optional[Callable[[ProcessStatus], None]] = None
+    ) -> ProcessStatus:
+        """Build a conda package from a CondaBuildSpec.
+
+        This is what build() calls; callers that already hold the options in a spec
+        can use it directly rather than spreading them back into keyword arguments.
+
+        Args:
+            spec: Recipe, build environment and conda build options
+            env: Environment variables to set for the build, on top of the current environment
+            status_callback: Callback for process status updates
+
+        Returns:
+            ProcessStatus: Process status object
+        """
+        # Reject contradictory options before spending a conda start-up on them
+        for first, second in _EXCLUSIVE_FLAGS:
+            if getattr(spec, first) and getattr(spec, second):
+                raise ValueError(f"{first} and {second} can't be used together")
+
+        if spec.fast_build:
+            spec = _apply_fast_build(spec)
+
         # Validate paths before starting build
-        errors = self._validate_paths(recipe_path, config_file, croot)
+        errors, paths = await self._validate_paths(spec.recipe_path, spec.config_file, spec.croot)
         if errors:
             raise ValueError("\n".join(errors))
         
         # Validate build environment exists
-        await self._validate_build_env(build_env)
-
-        # Construct base args
-        args = []
-        if recipe_path:
-            args.append(recipe_path)
+        await self._validate_build_env(spec.build_env)
 
-        # Add config options
-        if config_file:
-            args.extend(["--config-file", config_file])
-        if croot:
-            args.extend(["--croot", croot])
-        if channels:
-            if isinstance(channels, str):
-                args.extend(["-c", channels])
-            else:
-                for channel in channels:
-                    args.extend(["-c", channel])
-        if variant_config_files:
-            for file in variant_config_files:
-                args.extend(["--variant-config-file", file])
-        if exclusive_config_files:
-            for file in exclusive_config_files:
-                args.extend(["--exclusive-config-file", file])
-
-        # Add version specifications
-        if python_version:
-            args.extend(["--python", python_version])
-        if perl:
-            args.extend(["--perl", perl])
-        if numpy:
-            args.extend(["--numpy", numpy])
-        if r_base:
-            args.extend(["--R", r_base])
-        if lua:
-            args.extend(["--lua", lua])
-
-        # Add build options
-        if bootstrap:
-            args.extend(["--bootstrap", bootstrap])
-        if append_file:
-            args.extend(["--append-file", append_file])
-        if clobber_file:
-            args.extend(["--clobber-file", clobber_file])
-        if old_build_string:
-            args.append("--old-build-string")
-        if use_channeldata:
-            args.append("--use-channeldata")
-        if variants:
-            args.extend(["--variants", variants])
-        if check:
-            args.append("--check")
-        if no_include_recipe:
-            args.append("--no-include-recipe")
-        if source:
-            args.append("--source")
-        if test:
-            args.append("--test")
-        if no_test:
-            args.append("--no-test")
-        if build_only:
-            args.append("--build-only")
-        if post:
-            args.append("--post")
-        if test_run_post:
-            args.append("--test-run-post")
-        if skip_existing:
-            args.append("--skip-existing")
-        if keep_old_work:
-            args.append("--keep-old-work")
-        if dirty:
-            args.append("--dirty")
-        if debug:
-            args.append("--debug")
-
-        # Add upload options
-        if token:
-            args.extend(["--token", token])
-        if user:
-            args.extend(["--user", user])
-        if label:
-            args.extend(["--label", label])
-        if no_force_upload:
-            args.append("--no-force-upload")
-        if zstd_compression_level is not None:
-            args.extend(["--zstd-compression-level", str(zstd_compression_level)])
-        if password:
-            args.extend(["--password", password])
-        if sign:
-            args.extend(["--sign", sign])
-        if sign_with:
-            args.extend(["--sign-with", sign_with])
-        if identity:
-            args.extend(["--identity", identity])
-        if repository:
-            args.extend(["--repository", repository])
-
-        # Add environment options
-        if no_activate:
-            args.append("--no-activate")
-        if no_build_id:
-            args.append("--no-build-id")
-        if build_id_pat:
-            args.extend(["--build-id-pat", build_id_pat])
-
-        # Add verification options
-        if verify:
-            args.append("--verify")
-        if no_verify:
-            args.append("--no-verify")
-        if strict_verify:
-            args.append("--strict-verify")
-
-        # Add output options
-        if output_folder:
-            args.extend(["--output-folder", output_folder])
-        if no_prefix_length_fallback:
-            args.append("--no-prefix-length-fallback")
-        if prefix_length_fallback:
-            args.append("--prefix-length-fallback")
-        if prefix_length is not None:
-            args.extend(["--prefix-length", str(prefix_length)])
-
-        # Add locking and work directory options
-        if no_locking:
-            args.append("--no-locking")
-        if no_remove_work_dir:
-            args.append("--no-remove-work-dir")
-
-        # Add error handling options
-        if error_overlinking:
-            args.append("--error-overlinking")
-        if no_error_overlinking:
-            args.append("--no-error-overlinking")
-        if error_overdepending:
-            args.append("--error-overdepending")
-        if no_error_overdepending:
-            args.append("--no-error-overdepending")
-
-        # Add test prefix options
-        if long_test_prefix:
-            args.append("--long-test-prefix")
-        if no_long_test_prefix:
-            args.append("--no-long-test-prefix")
-
-        # Add build behavior options
-        if keep_going:
-            args.append("--keep-going")
-        if cache_dir:
-            args.extend(["--cache-dir", cache_dir])
-        if no_copy_test_source_files:
-            args.append("--no-copy-test-source-files")
-        if merge_build_host:
-            args.append("--merge-build-host")
-        if stats_file:
-            args.extend(["--stats-file", stats_file])
-
-        # Add extra dependencies and metadata
-        if extra_deps:
-            for dep in extra_deps:
-                args.extend(["--extra-deps", dep])
-        if extra_meta:
-            for key, value in extra_meta.items():
-                args.extend(["--extra-meta", f"{key}={value}"])
-
-        # Add channel options
-        if suppress_variables:
-            args.append("--suppress-variables")
-        if use_local:
-            args.append("--use-local")
-        if override_channels:
-            args.append("--override-channels")
-        if repodata_fn:
-            for fn in repodata_fn:
-                args.extend(["--repodata-fn", fn])
-
-        # Add experimental options
-        if experimental:
-            args.extend(["--experimental", experimental])
-        if no_lock:
-            args.append("--no-lock")
-        if repodata_use_zst is not None:
-            args.append("--repodata-use-zst" if repodata_use_zst else "--no-repodata-use-zst")
-
-        # Add default args
-        args.extend(self.default_args)
-
-        # Set up environment and command
-        if build_env:
+        # Start with the subcommand, so the arguments are built in a single list
+        if spec.build_env:
             # When using conda run, we need: conda run -n ENV conda build ARGS
-            args = ["run", "-n", build_env, "conda", "build"] + args
+            args = [*self.CONDA_RUN_ARGS, spec.build_env, *self.BUILD_ARGS]
         else:
             # Direct conda build: conda build ARGS
-            args = ["build"] + args
-
-        # Fork the build process
-        cwd = os.path.dirname(config_file) if config_file else None
-        status = await self.fork(
-            self.binary_path,
-            args,
-            env=env,
-            cwd=cwd,
-            enable_logging=True
-        )
-
-        # Add build_id to status for reference
-        build_id = f"{int(time.time())}_{os.path.basename(recipe_path)}"
+            args = ["build"]
+        if spec.recipe_path:
+            args.append(spec.recipe_path)
+
+        # Bound once, the loop below runs for every flag in the table
+        append = args.append
+        for name, flag, kind in _BUILD_FLAGS:
+            value = getattr(spec, name)
+            if kind == "number":
+                if value is not None:
+                    args += (flag, str(value))
+            elif not value:
+                continue
+            elif kind == "bool":
+                append(flag)
+            elif kind == "value":
+                args += (flag, value)
+            elif kind == "multi":
+                args += [part for item in value for part in (flag, item)]
+            elif kind == "mapping":
+                args += [part for key, item in value.items() for part in (flag, f"{key}={item}")]
+
+        if spec.repodata_use_zst is not None:
+            args.append("--repodata-use-zst" if spec.repodata_use_zst else "--no-repodata-use-zst")
+
+        # Add default args, leaving out the overlinking check when it's turned off
+        if spec.no_error_overlinking:
+            args.extend(arg for arg in self.DEFAULT_ARGS if arg != "--error-overlinking")
+        else:
+            args.extend(self.DEFAULT_ARGS)
+
+        cache_dir = None
+        status = None
+        if spec.cache_results:
+            try:
+                key = await asyncio.to_thread(self._build_fingerprint, spec.recipe_path, spec.config_file, args, env)
+            except OSError:
+                # A recipe file that can't be read is left for conda build to report, uncached
+                key = None
+            if key is not None:
+                cache_dir = os.path.join(self.log_dir, BUILD_CACHE_DIR, key)
+                status = await self._cached_build(cache_dir, args)
+
+        if status is None:
+            # Fork the build process, from the directory of the config file if one was given
+            config_path = paths.get('Config')
+            cwd = os.path.dirname(os.path.abspath(config_path)) if config_path else None
+            # Without env the build inherits the server's environment and nothing is copied;
+            # with it, the given variables are layered over that environment
+            status = await self.fork(
+                self.binary_path,
+                args,
+                env={**os.environ, **env} if env else None,
+                cwd=cwd
+            )
+            if cache_dir and status.process:
+                self._background_tasks.append(asyncio.create_task(self._cache_build(status, cache_dir)))
+
+        # Add build_id to status for reference, named after the recipe directory
+        recipe_name = (spec.recipe_path or "").rstrip(os.sep).rsplit(os.sep, 1)[-1]
+        build_id = f"{next(self._build_counter)}_{recipe_name}"
         status.build_id = build_id
+        if status.pid != -1:
+            self._build_pids[build_id] = status.pid
+            # Drop builds the runner has stopped tracking, so the index stays bounded
+            if len(self._build_pids) > MAX_TRACKED_PROCESSES:
+                self._build_pids = {
+                    key: pid for key, pid in self._build_pids.items() if pid in self._active_procs
+                }
+
+        return status
 
+    @staticmethod
+    def _build_fingerprint(recipe_path: str, config_file: Optional[str], args: List[str],
+                           env: Optional[Dict[str, str]]) -> str:
+        """Hash the recipe files' names, sizes and mtimes, the config file's contents,
+        the build arguments and environment, identifying builds that would produce the
+        same packages."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(orjson.dumps([args, sorted(env.items()) if env else None]))
+        if os.path.isdir(recipe_path):
+            dirs = [recipe_path]
+            while dirs:
+                with os.scandir(dirs.pop()) as entries:
+                    for entry in sorted(entries, key=lambda entry: entry.name):
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                        else:
+                            try:
+                                st = entry.stat()
+                            except OSError:
+                                # A dangling symlink, hash the link itself
+                                st = entry.stat(follow_symlinks=False)
+                            digest.update(f"{entry.path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+        else:
+            st = os.stat(recipe_path)
+            digest.update(f"{recipe_path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+        if config_file:
+            with open(config_file, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    async def _cached_build(self, cache_dir: str, args: List[str]) -> Optional[ProcessStatus]:
+        """Restore the packages of an earlier identical build, None if there wasn't one.
+
+        Packages missing from where the earlier build wrote them are copied back from
+        the cache. The returned status is already completed, with the earlier build's
+        log and a negative stand-in PID.
+        """
+        restored = await asyncio.to_thread(self._restore_packages, cache_dir)
+        if not restored:
+            return None
+        status = ProcessStatus(
+            cmd=self.binary_path,
+            args=args,
+            pid=next(self._cached_pids),
+            stdout='',
+            stderr='',
+            return_code=0,
+            log_file=Path(cache_dir, "build.log")
+        )
+        if self.track_processes:
+            self._track_process(status.pid, status)
         return status
 
+    @staticmethod
+    def _restore_packages(cache_dir: str) -> bool:
+        try:
+            with open(os.path.join(cache_dir, "manifest.json"), 'rb') as f:
+                packages = orjson.loads(f.read())
+        except FileNotFoundError:
+            return False
+        for name, path in packages.items():
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                shutil.copy2(os.path.join(cache_dir, name), path)
+        return True
+
+    async def _cache_build(self, status: ProcessStatus, cache_dir: str):
+        """Once the build succeeds, keep the packages named in its log in cache_dir."""
+        await status.process.wait()
+        stream_task = self._stream_tasks.get(status.pid)
+        if stream_task:
+            await stream_task
+        if status.process.returncode == 0:
+            await asyncio.to_thread(self._store_packages, status.log_file, cache_dir)
+
+    @staticmethod
+    def _store_packages(log_file: Path, cache_dir: str):
+        with open(log_file, 'rb') as f:
+            paths = {os.fsdecode(path) for path in _PACKAGE_PATH_RE.findall(f.read())}
+        packages = {os.path.basename(path): path for path in sorted(paths) if os.path.isfile(path)}
+        if not packages:
+            return
+
+        # Fill a temporary directory and rename it into place, so a cache entry is never partial
+        cache_root = os.path.dirname(cache_dir)
+        os.makedirs(cache_root, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=cache_root)
+        try:
+            for name, path in packages.items():
+                shutil.copy2(path, os.path.join(staging, name))
+            shutil.copy2(log_file, os.path.join(staging, "build.log"))
+            with open(os.path.join(staging, "manifest.json"), 'wb') as f:
+                f.write(orjson.dumps(packages))
+            os.rename(staging, cache_dir)
+        except OSError:
+            # Another build cached the same result first
+            shutil.rmtree(staging, ignore_errors=True)
+
+    async def build_many(self, specs: List[Union[CondaBuildSpec, Dict[str, Any]]]) -> List[ProcessStatus]:
+        """Start several conda builds concurrently.
+
+        Validation and process start-up for each build overlap, with at most
+        os.cpu_count() of them in flight at once. The builds themselves run in
+        the background as with build().
+
+        Args:
+            specs: One CondaBuildSpec, or dict of keyword arguments for build(), per build
+
+        Returns:
+            list: Process status objects in the same order as specs
+
+        Raises:
+            ValueError: If a dict has options build() doesn't take, before any build starts
+        """
+        for spec in specs:
+            if not isinstance(spec, CondaBuildSpec):
+                unknown = spec.keys() - _BUILD_KWARGS
+                if unknown:
+                    raise ValueError(f"Unknown build options: {', '.join(sorted(unknown))}")
+
+        limit = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def _start(spec: Union[CondaBuildSpec, Dict[str, Any]]) -> ProcessStatus:
+            async with limit:
+                if isinstance(spec, CondaBuildSpec):
+                    return await self.build_from_spec(spec)
+                return await self.build(**spec)
+
+        return list(await asyncio.gather(*(_start(spec) for spec in specs)))
+
+    async def read_process_log(self, pid: int, tail: Optional[int] = None) -> str:
+        """Read a build's log, reusing what earlier calls read.
+
+        Build logs are polled often and only ever appended to, so an unchanged
+        (mtime, size) returns the cached text without opening the file and a grown
+        log reads and decodes just the bytes after its last complete line. At most
+        LOG_CACHE_MAX_BYTES of logs are kept.
+        Tail reads already only touch the end of the file and aren't cached.
+        """
+        if tail or pid not in self._active_procs:
+            return await super().read_process_log(pid, tail)
+
+        log_file = self._active_procs[pid].log_file
+        try:
+            entry = await run_log_read(self._read_log_update, log_file, self._log_cache.get(pid))
+        except (FileNotFoundError, TypeError):
+            raise FileNotFoundError(f"Log file not found: {log_file}") from None
+
+        # Entries are never modified, only replaced, so a concurrent read of the same
+        # log at most reads the new bytes twice; the longer result is kept
+        cached = self._log_cache.pop(pid, None)
+        if cached and cached[1] > entry[1]:
+            entry = cached
+        if pid in self._active_procs and entry[1] <= LOG_CACHE_MAX_BYTES:
+            self._log_cache[pid] = entry
+            # Forget logs of processes that are no longer tracked, then the least recently read
+            for old_pid in [p for p in self._log_cache if p not in self._active_procs]:
+                del self._log_cache[old_pid]
+            size = sum(cached[1] for cached in self._log_cache.values())
+            while size > LOG_CACHE_MAX_BYTES:
+                size -= self._log_cache.pop(next(iter(self._log_cache)))[1]
+        return entry[2]
+
+    @staticmethod
+    def _read_log_update(
+        log_file: Path, cached: Optional[Tuple[int, int, str, int, int]]
+    ) -> Tuple[int, int, str, int, int]:
+        """Return a log file's cache entry, reading only the bytes after the last
+        complete line of cached when it still matches the start of the file.
+
+        A line ending is never part of a multi-byte UTF-8 character, so the complete
+        lines decode the same on their own and no decoder state is kept between reads.
+        """
+        st = os.stat(log_file)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached
+        if cached and cached[1] <= st.st_size:
+            _, _, text, offset, chars = cached
+            text = text[:chars]
+        else:
+            text, offset, chars = "", 0, 0
+        with open(log_file, 'rb') as f:
+            f.seek(offset)
+            data = f.read(st.st_size - offset)
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].decode(errors='replace')
+        text += lines + data[end:].decode(errors='replace')
+        return st.st_mtime_ns, offset + len(data), text, offset + end, chars + len(lines)
+
+    def _find_build(self, build_id: str) -> Optional[int]:
+        """Return the PID of the build with the given build_id, None if not found."""
+        pid = self._build_pids.get(build_id)
+        if pid is None:
+            return None
+        # Forget builds that are no longer tracked, or whose PID now belongs to another command
+        status = self.get_active_processes().get(pid)
+        if status is None or status.build_id != build_id:
+            del self._build_pids[build_id]
+            return None
+        return pid
+
     async def check_build_status(self, build_id: str) -> Dict[str, Any]:
         """Check the current status of a build process.
 
@@ -446,17 +880,16 @@ class AsyncCondaBuild(AsyncCondaCmd):
         Returns:
             dict: Build status information including current state and return code if completed
         """
-        # Find the process status with matching build_id
-        for pid, status in self.get_active_commands().items():
-            if hasattr(status, 'build_id') and status.build_id == build_id:
-                # Use AsyncProcessRunner's status tracking
-                cmd_status = self.get_command_status(pid)
-                cmd_status['build_id'] = build_id  # Add build_id to response
-                return cmd_status
+        pid = self._find_build(build_id)
+        if pid is None:
+            return {'status': 'not_found', 'build_id': build_id}
 
-        return {'status': 'not_found', 'build_id': build_id}
+        # Use AsyncProcessRunner's status tracking
+        cmd_status = self.get_process(pid)
+        cmd_status['build_id'] = build_id  # Add build_id to response
+        return cmd_status
 
-    def get_build_log(self, build_id: str, tail: Optional[int] = None) -> str:
+    async def get_build_log(self, build_id: str, tail: Optional[int] = None) -> str:
         """Get the log output from a build process.
 
         Args:
@@ -466,10 +899,9 @@ class AsyncCondaBuild(AsyncCondaCmd):
         Returns:
             str: Build log output
         """
-        # Find the process status with matching build_id
-        for pid, status in self.get_active_commands().items():
-            if hasattr(status, 'build_id') and status.build_id == build_id:
-                # Use AsyncProcessRunner's log retrieval
-                return self.get_command_log(pid, tail)
+        pid = self._find_build(build_id)
+        if pid is None:
+            return "Build ID not found"
 
-        return "Build ID not found"
\ No newline at end of file
+        # Use AsyncProcessRunner's log retrieval
+        return await self.read_process_log(pid, tail)
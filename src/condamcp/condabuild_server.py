@@ -2,18 +2,29 @@
 
 from mcp.server.fastmcp import FastMCP, Context
 from pathlib import Path
-from .condabuild import AsyncCondaBuild
+import functools
+from .condabuild import AsyncCondaBuild, CondaBuildSpec
 from .async_cmd import ProcessStatus
-from typing import Optional, List, Dict
+from .utils import follow_log, notify, report_errors
+from typing import Optional, List, Dict, Any
 
 mcp = FastMCP("CondaBuild")
 
-# Set up build logs directory
+# Build logs directory, created by AsyncProcessRunner
 logs_dir = Path.home() / ".condamcp" / "mcp" / "build_logs"
-logs_dir.mkdir(parents=True, exist_ok=True)
 
-# Initialize conda build wrapper
-conda_build = AsyncCondaBuild(log_dir=str(logs_dir))
+@functools.cache
+def _conda_build() -> AsyncCondaBuild:
+    """Return the conda build wrapper, created on first use.
+
+    Creating it makes the log directory and looks up the conda binary, which
+    importing the module only to list its tools doesn't need.
+    """
+    return AsyncCondaBuild(log_dir=str(logs_dir), track_processes=True)
+
+# Fixed tool responses, formatted with % where they take a value
+_MSG_CANCELLED = "Build %d cancelled successfully"
+_MSG_CANCEL_FAILED = "Failed to cancel build %d: %s"
 
 @mcp.tool()
 async def build(
@@ -91,12 +102,23 @@ async def build(
     no_lock: bool = False,
     repodata_use_zst: Optional[bool] = None,
     env: Optional[Dict[str, str]] = None,
-    quiet: bool = False
+    quiet: bool = False,
+    fast_build: bool = False,
+    cache_results: bool = False
 ) -> ProcessStatus:
     """Build a conda package from a recipe.
     
     This tool starts a conda build process and returns a process ID that can be used
     to check the status and logs using get_build_status() and get_build_log().
+
+    With fast_build, package tests, verification and the overlinking check are
+    skipped and the package is compressed at zstd level 1, for quick iteration
+    on a recipe. Options given explicitly (e.g. test or zstd_compression_level)
+    take precedence.
+
+    With cache_results, a build whose recipe files, config file and options match an
+    earlier successful build returns at once, completed, with that build's log and
+    packages instead of building again.
         
     Returns:
         ProcessStatus: Process status object
@@ -105,109 +127,54 @@ async def build(
         "Build the package in /path/to/recipe"
         "Build the recipe using config file /path/to/config.yaml"
         "Build the package and use the conda-forge channel"
+        "Do a fast build of /path/to/recipe without running the tests"
     """
-    try:
-        ctx.info(f"Starting conda build for recipe at '{recipe_path}'...")
-        await ctx.report_progress(0, 2)
+    async with report_errors(ctx):
+        if not quiet:
+            notify(ctx.info(f"Starting conda build for recipe at '{recipe_path}'..."))
         
-        # Run the conda build command
-        status = await conda_build.build(
-            build_env=build_env,
-            recipe_path=recipe_path,
-            config_file=config_file,
-            croot=croot,
-            channels=channels,
-            variant_config_files=variant_config_files,
-            exclusive_config_files=exclusive_config_files,
-            python_version=python_version,
-            perl=perl,
-            numpy=numpy,
-            r_base=r_base,
-            lua=lua,
-            bootstrap=bootstrap,
-            append_file=append_file,
-            clobber_file=clobber_file,
-            old_build_string=old_build_string,
-            use_channeldata=use_channeldata,
-            variants=variants,
-            check=check,
-            no_include_recipe=no_include_recipe,
-            source=source,
-            test=test,
-            no_test=no_test,
-            build_only=build_only,
-            post=post,
-            test_run_post=test_run_post,
-            skip_existing=skip_existing,
-            keep_old_work=keep_old_work,
-            dirty=dirty,
-            debug=debug,
-            token=token,
-            user=user,
-            label=label,
-            no_force_upload=no_force_upload,
-            zstd_compression_level=zstd_compression_level,
-            password=password,
-            sign=sign,
-            sign_with=sign_with,
-            identity=identity,
-            repository=repository,
-            no_activate=no_activate,
-            no_build_id=no_build_id,
-            build_id_pat=build_id_pat,
-            verify=verify,
-            no_verify=no_verify,
-            strict_verify=strict_verify,
-            output_folder=output_folder,
-            no_prefix_length_fallback=no_prefix_length_fallback,
-            prefix_length_fallback=prefix_length_fallback,
-            prefix_length=prefix_length,
-            no_locking=no_locking,
-            no_remove_work_dir=no_remove_work_dir,
-            error_overlinking=error_overlinking,
-            no_error_overlinking=no_error_overlinking,
-            error_overdepending=error_overdepending,
-            no_error_overdepending=no_error_overdepending,
-            long_test_prefix=long_test_prefix,
-            no_long_test_prefix=no_long_test_prefix,
-            keep_going=keep_going,
-            cache_dir=cache_dir,
-            no_copy_test_source_files=no_copy_test_source_files,
-            merge_build_host=merge_build_host,
-            stats_file=stats_file,
-            extra_deps=extra_deps,
-            extra_meta=extra_meta,
-            suppress_variables=suppress_variables,
-            use_local=use_local,
-            override_channels=override_channels,
-            repodata_fn=repodata_fn,
-            experimental=experimental,
-            no_lock=no_lock,
-            repodata_use_zst=repodata_use_zst,
-            env=env,
-            quiet=quiet
-        )
+        # Run the conda build command, with the spec built from the tool arguments
+        spec = CondaBuildSpec.from_options(locals())
+        status = await _conda_build().build_from_spec(spec, env=env)
         
         await ctx.report_progress(2, 2)  # Mark as complete
         
         return status
-        
-    except Exception as e:
-        ctx.error(f"Error: {str(e)}")
-        raise  # Re-raise the exception to properly handle it in the MCP framework
 
 @mcp.tool()
-def cancel_build(pid: int):
+async def build_many(
+    ctx: Context,
+    builds: List[Dict[str, Any]]
+) -> List[ProcessStatus]:
+    """Start several conda builds at once.
+
+    Each entry takes the same arguments as the build tool (build_env and recipe_path
+    are required). The builds run concurrently in the background; use get_build_status()
+    and get_build_log() with each returned process ID.
+
+    Returns:
+        List[ProcessStatus]: Process status objects, in the same order as builds
+
+    Examples:
+        "Build the recipes in /path/to/recipe-a and /path/to/recipe-b"
+        "Build gguf and llama.cpp at the same time using the build environment"
+    """
+    async with report_errors(ctx):
+        notify(ctx.info(f"Starting {len(builds)} conda builds..."))
+        return await _conda_build().build_many(builds)
+
+@mcp.tool()
+async def cancel_build(pid: int):
     """Cancel a running conda build.
     
     Args:
         pid: Process ID of the build to cancel
     """
     try:
-        conda_build.kill_process(pid)
-        return f"Build {pid} cancelled successfully"
+        await _conda_build().cancel_process(pid)
+        return _MSG_CANCELLED % pid
     except Exception as e:
-        return f"Failed to cancel build {pid}: {e}"
+        return _MSG_CANCEL_FAILED % (pid, e)
 
 
 @mcp.tool()
@@ -223,18 +190,26 @@ async def get_build_status(pid: int) -> str:
         "Check the status of my latest build"
         "What is the status of build 1234567890?"
     """
-    status = await conda_build.get_process(pid)
+    status = _conda_build().get_process(pid)
     if status['status'] in ['completed', 'failed']:
         return f"Build {pid} status: {status['status']}"
     else:
         return f"Build {pid} is still running"
 
+# Lines get_build_log returns by default, and at most
+BUILD_LOG_TAIL_LINES = 1000
+BUILD_LOG_MAX_LINES = 10000
+
 @mcp.tool()
-async def get_build_log(pid: int, tail: int | None = None) -> str:
-    """Get some or all of the log output from a conda build.
+async def get_build_log(pid: int, tail: int = BUILD_LOG_TAIL_LINES) -> str:
+    """Get the last lines of the log output from a conda build, running or finished.
+
+    At most BUILD_LOG_MAX_LINES lines are returned. Use get_build_log_path() to read
+    the whole log from the filesystem.
+
     Args:
         pid: The process ID returned from build_package
-        tail: Number of lines to return from end of log (None for all)
+        tail: Number of lines to return from end of log (default: 1000)
     Returns:
         str: Build log output
 
@@ -243,14 +218,72 @@ async def get_build_log(pid: int, tail: int | None = None) -> str:
         "What is the log for my latest build?"
         "Show the last 100 lines of the log for build 1234567890"
     """
-    status = await conda_build.get_process(pid)
-    if status['status'] in ['completed', 'failed']:
-        if status.log_file:
-            return await conda_build.get_process_log(pid)
-        else:
-            return f"No log file available for build {pid}"
-    else:
-        return f"Build {pid} is still running"
+    conda_build = _conda_build()
+    if conda_build.get_process(pid)['status'] == 'not_found':
+        return f"Build {pid} not found"
+    tail = max(1, min(tail, BUILD_LOG_MAX_LINES))
+    try:
+        # A tail only reads the end of the file, however large the log has grown
+        text, truncated = await conda_build.read_log_tail(pid, tail)
+    except FileNotFoundError:
+        return f"No log file available for build {pid}"
+    if truncated:
+        log_file = conda_build.get_active_processes()[pid].log_file
+        text = f"[last {tail} lines, full log at {log_file}]\n{text}"
+    return text
+
+@mcp.tool()
+async def get_build_log_path(pid: int) -> str:
+    """Get the path of a conda build's log file, for reading or following the whole
+    log directly on the filesystem.
+
+    Args:
+        pid: The process ID returned from build_package
+    Returns:
+        str: Path of the build log
+
+    Examples:
+        "Where is the log file for build 1234567890?"
+    """
+    status = _conda_build().get_active_processes().get(pid)
+    if status is None or not status.log_file:
+        return f"No log file available for build {pid}"
+    return str(status.log_file)
+
+# Lines of build output kept for the result of follow_build
+FOLLOW_TAIL_LINES = 200
+
+@mcp.tool()
+async def follow_build(
+    ctx: Context,
+    pid: int,
+    timeout_seconds: int = 3600
+) -> str:
+    """Follow a running conda build, sending its new log lines to the client as they
+    are written, and return the end of the log once the build finishes.
+
+    Progress notifications carry the number of log lines written so far, since a
+    build's total length isn't known in advance.
+
+    Args:
+        ctx: MCP context for streaming output
+        pid: The process ID returned from build
+        timeout_seconds: Maximum time to follow the build in seconds (default: 3600)
+    Returns:
+        str: The last lines of the build log (up to FOLLOW_TAIL_LINES)
+
+    Examples:
+        "Follow the build and show me what it's doing"
+        "Watch build 1234567890 until it finishes"
+    """
+    conda_build = _conda_build()
+    if conda_build.get_process(pid)['status'] == 'not_found':
+        return f"Build {pid} not found"
+
+    async with report_errors(ctx):
+        return await follow_log(
+            ctx, conda_build, pid, timeout_seconds, FOLLOW_TAIL_LINES, count_lines=True
+        )
 
 @mcp.prompt()
 def create_build_environment_prompt(name: str) -> str:
@@ -6,10 +6,261 @@ Conda command wrapper that uses `commandlr` to build and execute commands.
 
 from .async_cmd import AsyncProcessRunner, ProcessStatus
 from .utils import get_default_conda_binary
-import json
 from typing import List, Optional, Callable, Dict, Union, Tuple, Literal
 from enum import Enum
 
+# Flags shared by `conda install` and `conda update`, as (option name, flag, kind)
+# in the order they are passed to conda. Kinds: "bool" appends the flag when the
+# option is true, "value" appends the flag and the option's value, "multi" repeats
+# the flag for each item, "list" appends the flag once followed by every item, and
+# "toggle" is a tri-state that appends either the flag or its --no- form when the
+# option is not None. The tables below do the same for the other commands.
+_INSTALL_FLAGS = (
+    # Channel options
+    ("channels", "-c", "multi"),
+    ("use_local", "--use-local", "bool"),
+    ("override_channels", "--override-channels", "bool"),
+    ("repodata_fn", "--repodata-fn", "multi"),
+    ("experimental", "--experimental", "value"),
+    ("no_lock", "--no-lock", "bool"),
+    ("repodata_use_zst", "--repodata-use-zst", "toggle"),
+    # Solver options
+    ("strict_channel_priority", "--strict-channel-priority", "bool"),
+    ("no_channel_priority", "--no-channel-priority", "bool"),
+    ("no_deps", "--no-deps", "bool"),
+    ("only_deps", "--only-deps", "bool"),
+    ("no_pin", "--no-pin", "bool"),
+    ("solver", "--solver", "value"),
+    ("force_reinstall", "--force-reinstall", "bool"),
+    ("freeze_installed", "--freeze-installed", "bool"),
+    ("update_deps", "--update-deps", "bool"),
+    ("satisfied_skip_solve", "-S", "bool"),
+    ("update_all", "--update-all", "bool"),
+    ("update_specs", "--update-specs", "bool"),
+    # Package linking options
+    ("copy", "--copy", "bool"),
+    ("no_shortcuts", "--no-shortcuts", "bool"),
+    ("shortcuts_only", "--shortcuts-only", "multi"),
+    ("clobber", "--clobber", "bool"),
+    # Networking options
+    ("use_index_cache", "-C", "bool"),
+    ("insecure", "-k", "bool"),
+    ("offline", "--offline", "bool"),
+    # Output options
+    ("dry_run", "-d", "bool"),
+    ("yes", "-y", "bool"),
+    ("as_json", "--json", "bool"),
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+    ("console", "--console", "value"),
+    ("download_only", "--download-only", "bool"),
+    ("show_channel_urls", "--show-channel-urls", "bool"),
+)
+
+_ENV_FLAGS = (
+    ("channels", "-c", "multi"),
+    ("use_local", "--use-local", "bool"),
+    ("override_channels", "--override-channels", "bool"),
+    ("as_json", "--json", "bool"),
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+    ("offline", "--offline", "bool"),
+)
+
+_REMOVE_FLAGS = (
+    ("all", "--all", "bool"),
+    ("keep_env", "--keep-env", "bool"),
+    ("channels", "-c", "multi"),
+    ("use_local", "--use-local", "bool"),
+    ("override_channels", "--override-channels", "bool"),
+    ("repodata_fn", "--repodata-fn", "multi"),
+    ("experimental", "--experimental", "value"),
+    ("no_lock", "--no-lock", "bool"),
+    ("repodata_use_zst", "--repodata-use-zst", "toggle"),
+    ("features", "--features", "bool"),
+    ("force_remove", "--force-remove", "bool"),
+    ("no_pin", "--no-pin", "bool"),
+    ("solver", "--solver", "value"),
+    ("use_index_cache", "-C", "bool"),
+    ("insecure", "-k", "bool"),
+    ("offline", "--offline", "bool"),
+    ("dry_run", "-d", "bool"),
+    ("yes", "-y", "bool"),
+    ("as_json", "--json", "bool"),
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+    ("console", "--console", "value"),
+    ("dev", "--dev", "bool"),
+)
+
+_CREATE_FLAGS = (
+    # Package sources
+    ("clone", "--clone", "value"),
+    ("file", "--file", "value"),
+    # Channel options
+    ("channels", "-c", "multi"),
+    ("use_local", "--use-local", "bool"),
+    ("override_channels", "--override-channels", "bool"),
+    ("repodata_fn", "--repodata-fn", "multi"),
+    ("experimental", "--experimental", "value"),
+    ("no_lock", "--no-lock", "bool"),
+    ("repodata_use_zst", "--repodata-use-zst", "toggle"),
+    # Solver options
+    ("strict_channel_priority", "--strict-channel-priority", "bool"),
+    ("no_channel_priority", "--no-channel-priority", "bool"),
+    ("no_deps", "--no-deps", "bool"),
+    ("only_deps", "--only-deps", "bool"),
+    ("no_pin", "--no-pin", "bool"),
+    ("no_default_packages", "--no-default-packages", "bool"),
+    ("solver", "--solver", "value"),
+    # Package linking options
+    ("copy", "--copy", "bool"),
+    ("no_shortcuts", "--no-shortcuts", "bool"),
+    ("shortcuts_only", "--shortcuts-only", "multi"),
+    # Networking options
+    ("use_index_cache", "-C", "bool"),
+    ("insecure", "-k", "bool"),
+    ("offline", "--offline", "bool"),
+    # Output options
+    ("dry_run", "-d", "bool"),
+    ("yes", "-y", "bool"),
+    ("as_json", "--json", "bool"),
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+    ("console", "--console", "value"),
+    ("download_only", "--download-only", "bool"),
+    ("show_channel_urls", "--show-channel-urls", "bool"),
+    # Platform and development options
+    ("subdir", "--subdir", "value"),
+    ("dev", "--dev", "bool"),
+)
+
+_EXPORT_FLAGS = (
+    ("file", "-f", "value"),
+    ("channels", "-c", "multi"),
+    ("override_channels", "--override-channels", "bool"),
+    ("no_builds", "--no-builds", "bool"),
+    ("ignore_channels", "--ignore-channels", "bool"),
+    ("from_history", "--from-history", "bool"),
+    ("as_json", "--json", "bool"),
+    ("console", "--console", "value"),
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+)
+
+_CLEAN_FLAGS = (
+    # Removal targets
+    ("all", "--all", "bool"),
+    ("index_cache", "--index-cache", "bool"),
+    ("packages", "--packages", "bool"),
+    ("tarballs", "--tarballs", "bool"),
+    ("force_pkgs_dirs", "--force-pkgs-dirs", "bool"),
+    ("tempfiles", "--tempfiles", "list"),
+    ("logfiles", "--logfiles", "bool"),
+    # Output options
+    ("dry_run", "-d", "bool"),
+    ("yes", "-y", "bool"),
+    ("as_json", "--json", "bool"),
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+    ("console", "--console", "value"),
+)
+
+_LIST_FLAGS = (
+    ("show_channel_urls", "--show-channel-urls", "bool"),
+    ("reverse", "--reverse", "bool"),
+    ("canonical", "--canonical", "bool"),
+    ("full_name", "--full-name", "bool"),
+    ("explicit", "--explicit", "bool"),
+    ("md5", "--md5", "bool"),
+    ("sha256", "--sha256", "bool"),
+    ("export", "--export", "bool"),
+    ("revisions", "--revisions", "bool"),
+    ("no_pip", "--no-pip", "bool"),
+    ("auth", "--auth", "bool"),
+    ("as_json", "--json", "bool"),
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+)
+
+_SEARCH_FLAGS = (
+    # Search options
+    ("envs", "--envs", "bool"),
+    ("info", "--info", "bool"),
+    ("subdir", "--subdir", "value"),
+    ("skip_flexible_search", "--skip-flexible-search", "bool"),
+    # Channel options
+    ("channels", "-c", "multi"),
+    ("use_local", "--use-local", "bool"),
+    ("override_channels", "--override-channels", "bool"),
+    # Repodata options
+    ("repodata_fn", "--repodata-fn", "multi"),
+    ("experimental", "--experimental", "value"),
+    ("no_lock", "--no-lock", "bool"),
+    ("repodata_use_zst", "--repodata-use-zst", "toggle"),
+    # Networking options
+    ("offline", "--offline", "bool"),
+    ("use_index_cache", "-C", "bool"),
+    ("insecure", "-k", "bool"),
+    # Output options
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+    ("as_json", "--json", "bool"),
+)
+
+_RUN_FLAGS = (
+    ("verbose", "-v", "bool"),
+    ("dev", "--dev", "bool"),
+    ("debug_wrapper_scripts", "--debug-wrapper-scripts", "bool"),
+    ("cwd", "--cwd", "value"),
+    ("no_capture_output", "--no-capture-output", "bool"),
+)
+
+_COMPARE_FLAGS = (
+    ("as_json", "--json", "bool"),
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+    ("console", "--console", "value"),
+)
+
+_INFO_FLAGS = (
+    # Info targets
+    ("all", "--all", "bool"),
+    ("base", "--base", "bool"),
+    ("envs", "--envs", "bool"),
+    ("system", "--system", "bool"),
+    ("unsafe_channels", "--unsafe-channels", "bool"),
+    # Output options
+    ("verbose", "-v", "bool"),
+    ("quiet", "-q", "bool"),
+    ("as_json", "--json", "bool"),
+)
+
+# Arguments always added for some `conda env` subcommands
+_ENV_EXTRA_ARGS = {
+    "create": ("-y",),  # Avoid prompts for create
+}
+
+def _append_flags(args: List[str], table: Tuple[Tuple[str, str, str], ...], values: Dict) -> None:
+    """Append the flags in table for the options set in values (e.g. locals())."""
+    append = args.append
+    for name, flag, kind in table:
+        value = values[name]
+        if kind == "toggle":
+            if value is not None:
+                append(flag if value else "--no-" + flag[2:])
+        elif not value:
+            continue
+        elif kind == "bool":
+            append(flag)
+        elif kind == "value":
+            args += (flag, value)
+        elif kind == "multi":
+            args += [part for item in value for part in (flag, item)]
+        elif kind == "list":
+            append(flag)
+            args += value
+
 class CondaEnvCommand(str, Enum):
     """Valid subcommands for conda env"""
     CONFIG = "config"
@@ -19,30 +270,14 @@ class CondaEnvCommand(str, Enum):
     REMOVE = "remove"
     UPDATE = "update"
 
+# Subcommand names accepted by AsyncCondaCmd.env()
+ENV_COMMANDS = frozenset(command.value for command in CondaEnvCommand)
+
 class AsyncCondaCmd(AsyncProcessRunner):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.binary_path = get_default_conda_binary()
     
-    async def _parse_json_output(self, status: ProcessStatus, output_lines: List[str]) -> tuple[ProcessStatus, dict]:
-        """Parse accumulated output lines as JSON.
-        
-        Args:
-            status: The final ProcessStatus from the command
-            output_lines: List of output lines to parse as JSON
-            
-        Returns:
-            tuple: (ProcessStatus, dict) containing the status and parsed JSON
-            
-        Raises:
-            ValueError: If JSON parsing fails
-        """
-        try:
-            json_result = json.loads(''.join(output_lines))
-            return status, json_result
-        except json.JSONDecodeError:
-            raise ValueError("Invalid JSON response from conda command")
-    
     async def env(
         self,
         command: Union[CondaEnvCommand, Literal["config", "create", "export", "list", "remove", "update"]],
@@ -85,43 +320,31 @@ class AsyncCondaCmd(AsyncProcessRunner):
             ProcessStatus object for tracking the command execution. The caller can use
             get_command_status(pid) to check status and get_command_log(pid) to retrieve the raw
             command output.
+
+        Raises:
+            ValueError: If command isn't a conda env subcommand
         """
+        # Pass conda the plain string rather than the enum member
+        if isinstance(command, CondaEnvCommand):
+            command = command.value
+        elif command not in ENV_COMMANDS:
+            raise ValueError(f"Unknown conda env command: {command}")
         cmd_args = ["env", command]
         
         # Handle environment specification
         if name:
-            cmd_args.extend(["-n", name])
+            cmd_args.extend(("-n", name))
         if prefix:
-            cmd_args.extend(["-p", prefix])
+            cmd_args.extend(("-p", prefix))
             
         # Handle package specs
         if packages:
             cmd_args.extend(packages)
             
-        # Handle channels
-        if channels:
-            for channel in channels:
-                cmd_args.extend(["-c", channel])
-        if use_local:
-            cmd_args.append("--use-local")
-        if override_channels:
-            cmd_args.append("--override-channels")
-            
-        # Handle output options
-        if as_json:
-            cmd_args.append("--json")
-        if verbose:
-            cmd_args.append("-v")
-        if quiet:
-            cmd_args.append("-q")
-            
-        # Handle networking options
-        if offline:
-            cmd_args.append("--offline")
+        _append_flags(cmd_args, _ENV_FLAGS, locals())
             
         # Handle special cases for specific commands
-        if command == "create":
-            cmd_args.append("-y")  # Always add -y to avoid prompts for create
+        cmd_args += _ENV_EXTRA_ARGS.get(command, ())
             
         # Fork the process and enable logging
         return await self.fork(
@@ -183,63 +406,15 @@ class AsyncCondaCmd(AsyncProcessRunner):
         
         # Handle environment specification
         if name:
-            args.extend(["-n", name])
+            args.extend(("-n", name))
         if prefix:
-            args.extend(["-p", prefix])
+            args.extend(("-p", prefix))
             
         # Handle package specs
         if packages:
             args.extend(packages)
             
-        # Add options
-        if all:
-            args.append("--all")
-        if keep_env:
-            args.append("--keep-env")
-        if channels:
-            for channel in channels:
-                args.extend(["-c", channel])
-        if use_local:
-            args.append("--use-local")
-        if override_channels:
-            args.append("--override-channels")
-        if repodata_fn:
-            for fn in repodata_fn:
-                args.extend(["--repodata-fn", fn])
-        if experimental:
-            args.extend(["--experimental", experimental])
-        if no_lock:
-            args.append("--no-lock")
-        if repodata_use_zst is not None:
-            args.append("--repodata-use-zst" if repodata_use_zst else "--no-repodata-use-zst")
-        if features:
-            args.append("--features")
-        if force_remove:
-            args.append("--force-remove")
-        if no_pin:
-            args.append("--no-pin")
-        if solver:
-            args.extend(["--solver", solver])
-        if use_index_cache:
-            args.append("-C")
-        if insecure:
-            args.append("-k")
-        if offline:
-            args.append("--offline")
-        if dry_run:
-            args.append("-d")
-        if yes:
-            args.append("-y")
-        if as_json:
-            args.append("--json")
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
-        if console:
-            args.extend(["--console", console])
-        if dev:
-            args.append("--dev")
+        _append_flags(args, _REMOVE_FLAGS, locals())
 
         return await self.fork(self.binary_path, args)
 
@@ -332,94 +507,15 @@ class AsyncCondaCmd(AsyncProcessRunner):
         
         # Handle environment specification
         if name:
-            args.extend(["-n", name])
+            args.extend(("-n", name))
         if prefix:
-            args.extend(["-p", prefix])
+            args.extend(("-p", prefix))
             
-        # Handle package specs and sources
+        # Handle package specs
         if packages:
             args.extend(packages)
-        if clone:
-            args.extend(["--clone", clone])
-        if file:
-            args.extend(["--file", file])
-            
-        # Handle channels
-        if channels:
-            for channel in channels:
-                args.extend(["-c", channel])
-        if use_local:
-            args.append("--use-local")
-        if override_channels:
-            args.append("--override-channels")
-        if repodata_fn:
-            for fn in repodata_fn:
-                args.extend(["--repodata-fn", fn])
-        if experimental:
-            args.extend(["--experimental", experimental])
-        if no_lock:
-            args.append("--no-lock")
-        if repodata_use_zst is not None:
-            args.append("--repodata-use-zst" if repodata_use_zst else "--no-repodata-use-zst")
-            
-        # Handle solver options
-        if strict_channel_priority:
-            args.append("--strict-channel-priority")
-        if no_channel_priority:
-            args.append("--no-channel-priority")
-        if no_deps:
-            args.append("--no-deps")
-        if only_deps:
-            args.append("--only-deps")
-        if no_pin:
-            args.append("--no-pin")
-        if no_default_packages:
-            args.append("--no-default-packages")
-        if solver:
-            args.extend(["--solver", solver])
-            
-        # Handle package linking options
-        if copy:
-            args.append("--copy")
-        if no_shortcuts:
-            args.append("--no-shortcuts")
-        if shortcuts_only:
-            for pkg in shortcuts_only:
-                args.extend(["--shortcuts-only", pkg])
-                
-        # Handle networking options
-        if use_index_cache:
-            args.append("-C")
-        if insecure:
-            args.append("-k")
-        if offline:
-            args.append("--offline")
             
-        # Handle output options
-        if dry_run:
-            args.append("-d")
-        if yes:
-            args.append("-y")
-        if as_json:
-            args.append("--json")
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
-        if console:
-            args.extend(["--console", console])
-        if download_only:
-            args.append("--download-only")
-        if show_channel_urls:
-            args.append("--show-channel-urls")
-            
-        # Handle platform options
-        if subdir:
-            args.extend(["--subdir", subdir])
-            
-        # Handle development options
-        if dev:
-            args.append("--dev")
+        _append_flags(args, _CREATE_FLAGS, locals())
             
         # Fork the process and enable logging
         return await self.fork(self.binary_path, args)
@@ -467,38 +563,11 @@ class AsyncCondaCmd(AsyncProcessRunner):
 
         # Handle environment specification
         if name:
-            args.extend(["-n", name])
+            args.extend(("-n", name))
         if prefix:
-            args.extend(["-p", prefix])
+            args.extend(("-p", prefix))
 
-        # Handle file output
-        if file:
-            args.extend(["-f", file])
-
-        # Handle channels
-        if channels:
-            for channel in channels:
-                args.extend(["-c", channel])
-        if override_channels:
-            args.append("--override-channels")
-
-        # Handle export options
-        if no_builds:
-            args.append("--no-builds")
-        if ignore_channels:
-            args.append("--ignore-channels")
-        if from_history:
-            args.append("--from-history")
-
-        # Handle output options
-        if as_json:
-            args.append("--json")
-        if console:
-            args.extend(["--console", console])
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
+        _append_flags(args, _EXPORT_FLAGS, locals())
 
         return await self.fork(self.binary_path, args)
     
@@ -566,37 +635,7 @@ class AsyncCondaCmd(AsyncProcessRunner):
             command output.
         """
         args = ["clean"]
-        
-        # Handle removal targets
-        if all:
-            args.append("--all")
-        if index_cache:
-            args.append("--index-cache")
-        if packages:
-            args.append("--packages")
-        if tarballs:
-            args.append("--tarballs")
-        if force_pkgs_dirs:
-            args.append("--force-pkgs-dirs")
-        if tempfiles:
-            args.append("--tempfiles")
-            args.extend(tempfiles)
-        if logfiles:
-            args.append("--logfiles")
-            
-        # Handle output options
-        if dry_run:
-            args.append("-d")
-        if yes:
-            args.append("-y")
-        if as_json:
-            args.append("--json")
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
-        if console:
-            args.extend(["--console", console])
+        _append_flags(args, _CLEAN_FLAGS, locals())
 
         return await self.fork(self.binary_path, args)
 
@@ -694,96 +733,17 @@ class AsyncCondaCmd(AsyncProcessRunner):
         
         # Handle environment specification
         if name:
-            args.extend(["-n", name])
+            args.extend(("-n", name))
         if prefix:
-            args.extend(["-p", prefix])
+            args.extend(("-p", prefix))
             
         # Handle package specs and sources
         if packages:
             args.extend(packages)
         if file:
-            args.extend(["--file", file])
-            
-        # Handle channels
-        if channels:
-            for channel in channels:
-                args.extend(["-c", channel])
-        if use_local:
-            args.append("--use-local")
-        if override_channels:
-            args.append("--override-channels")
-        if repodata_fn:
-            for fn in repodata_fn:
-                args.extend(["--repodata-fn", fn])
-        if experimental:
-            args.extend(["--experimental", experimental])
-        if no_lock:
-            args.append("--no-lock")
-        if repodata_use_zst is not None:
-            args.append("--repodata-use-zst" if repodata_use_zst else "--no-repodata-use-zst")
-            
-        # Handle solver options
-        if strict_channel_priority:
-            args.append("--strict-channel-priority")
-        if no_channel_priority:
-            args.append("--no-channel-priority")
-        if no_deps:
-            args.append("--no-deps")
-        if only_deps:
-            args.append("--only-deps")
-        if no_pin:
-            args.append("--no-pin")
-        if solver:
-            args.extend(["--solver", solver])
-        if force_reinstall:
-            args.append("--force-reinstall")
-        if freeze_installed:
-            args.append("--freeze-installed")
-        if update_deps:
-            args.append("--update-deps")
-        if satisfied_skip_solve:
-            args.append("-S")
-        if update_all:
-            args.append("--update-all")
-        if update_specs:
-            args.append("--update-specs")
-            
-        # Handle package linking options
-        if copy:
-            args.append("--copy")
-        if no_shortcuts:
-            args.append("--no-shortcuts")
-        if shortcuts_only:
-            for pkg in shortcuts_only:
-                args.extend(["--shortcuts-only", pkg])
-        if clobber:
-            args.append("--clobber")
-                
-        # Handle networking options
-        if use_index_cache:
-            args.append("-C")
-        if insecure:
-            args.append("-k")
-        if offline:
-            args.append("--offline")
+            args.extend(("--file", file))
             
-        # Handle output options
-        if dry_run:
-            args.append("-d")
-        if yes:
-            args.append("-y")
-        if as_json:
-            args.append("--json")
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
-        if console:
-            args.extend(["--console", console])
-        if download_only:
-            args.append("--download-only")
-        if show_channel_urls:
-            args.append("--show-channel-urls")
+        _append_flags(args, _INSTALL_FLAGS, locals())
 
         return await self.fork(self.binary_path, args)
 
@@ -840,43 +800,15 @@ class AsyncCondaCmd(AsyncProcessRunner):
         
         # Handle environment specification
         if name:
-            args.extend(["-n", name])
+            args.extend(("-n", name))
         if prefix:
-            args.extend(["-p", prefix])
+            args.extend(("-p", prefix))
             
-        # Handle filtering and formatting
+        # Handle filtering
         if regex:
             args.append(regex)
-        if show_channel_urls:
-            args.append("--show-channel-urls")
-        if reverse:
-            args.append("--reverse")
-        if canonical:
-            args.append("--canonical")
-        if full_name:
-            args.append("--full-name")
-        if explicit:
-            args.append("--explicit")
-        if md5:
-            args.append("--md5")
-        if sha256:
-            args.append("--sha256")
-        if export:
-            args.append("--export")
-        if revisions:
-            args.append("--revisions")
-        if no_pip:
-            args.append("--no-pip")
-        if auth:
-            args.append("--auth")
             
-        # Handle output options
-        if as_json:
-            args.append("--json")
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
+        _append_flags(args, _LIST_FLAGS, locals())
             
         return await self.fork(self.binary_path, args)
     
@@ -917,21 +849,11 @@ class AsyncCondaCmd(AsyncProcessRunner):
         
         # Handle environment specification
         if name:
-            args.extend(["-n", name])
+            args.extend(("-n", name))
         if prefix:
-            args.extend(["-p", prefix])
+            args.extend(("-p", prefix))
             
-        # Handle options
-        if verbose:
-            args.append("-v")
-        if dev:
-            args.append("--dev")
-        if debug_wrapper_scripts:
-            args.append("--debug-wrapper-scripts")
-        if cwd:
-            args.extend(["--cwd", cwd])
-        if no_capture_output:
-            args.append("--no-capture-output")
+        _append_flags(args, _RUN_FLAGS, locals())
             
         # Add executable and its arguments
         args.extend(executable_call)
@@ -1037,103 +959,22 @@ class AsyncCondaCmd(AsyncProcessRunner):
         
         # Handle environment specification
         if name:
-            args.extend(["-n", name])
+            args.extend(("-n", name))
         if prefix:
-            args.extend(["-p", prefix])
+            args.extend(("-p", prefix))
             
         # Handle package specs and sources
         if packages:
             args.extend(packages)
         if revision:
-            args.extend(["--revision", revision])
+            args.extend(("--revision", revision))
         if file:
-            args.extend(["--file", file])
-            
-        # Handle channels
-        if channels:
-            for channel in channels:
-                args.extend(["-c", channel])
-        if use_local:
-            args.append("--use-local")
-        if override_channels:
-            args.append("--override-channels")
-        if repodata_fn:
-            for fn in repodata_fn:
-                args.extend(["--repodata-fn", fn])
-        if experimental:
-            args.extend(["--experimental", experimental])
-        if no_lock:
-            args.append("--no-lock")
-        if repodata_use_zst is not None:
-            args.append("--repodata-use-zst" if repodata_use_zst else "--no-repodata-use-zst")
-            
-        # Handle solver options
-        if strict_channel_priority:
-            args.append("--strict-channel-priority")
-        if no_channel_priority:
-            args.append("--no-channel-priority")
-        if no_deps:
-            args.append("--no-deps")
-        if only_deps:
-            args.append("--only-deps")
-        if no_pin:
-            args.append("--no-pin")
-        if solver:
-            args.extend(["--solver", solver])
-        if force_reinstall:
-            args.append("--force-reinstall")
-        if freeze_installed:
-            args.append("--freeze-installed")
-        if update_deps:
-            args.append("--update-deps")
-        if satisfied_skip_solve:
-            args.append("-S")
-        if update_all:
-            args.append("--update-all")
-        if update_specs:
-            args.append("--update-specs")
+            args.extend(("--file", file))
             
-        # Handle package linking options
-        if copy:
-            args.append("--copy")
-        if no_shortcuts:
-            args.append("--no-shortcuts")
-        if shortcuts_only:
-            for pkg in shortcuts_only:
-                args.extend(["--shortcuts-only", pkg])
-        if clobber:
-            args.append("--clobber")
-                
-        # Handle networking options
-        if use_index_cache:
-            args.append("-C")
-        if insecure:
-            args.append("-k")
-        if offline:
-            args.append("--offline")
-            
-        # Handle output options
-        if dry_run:
-            args.append("-d")
-        if yes:
-            args.append("-y")
-        if as_json:
-            args.append("--json")
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
-        if console:
-            args.extend(["--console", console])
-        if download_only:
-            args.append("--download-only")
-        if show_channel_urls:
-            args.append("--show-channel-urls")
-            
-        # Handle development options
+        _append_flags(args, _INSTALL_FLAGS, locals())
         if dev:
             args.append("--dev")
-        
+
         return await self.fork(self.binary_path, args)
 
 
@@ -1173,19 +1014,11 @@ class AsyncCondaCmd(AsyncProcessRunner):
 
         # Handle environment specification
         if name:
-            args.extend(["-n", name])
+            args.extend(("-n", name))
         elif prefix:
-            args.extend(["-p", prefix])
-
-        # Handle output options
-        if as_json:
-            args.append("--json")
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
-        if console:
-            args.extend(["--console", console])
+            args.extend(("-p", prefix))
+
+        _append_flags(args, _COMPARE_FLAGS, locals())
 
         return await self.fork(self.binary_path, args)
 
@@ -1222,26 +1055,7 @@ class AsyncCondaCmd(AsyncProcessRunner):
             command output.
         """
         args = ["info"]
-        
-        # Handle info targets
-        if all:
-            args.append("--all")
-        if base:
-            args.append("--base")
-        if envs:
-            args.append("--envs")
-        if system:
-            args.append("--system")
-        if unsafe_channels:
-            args.append("--unsafe-channels")
-            
-        # Handle output options
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
-        if as_json:
-            args.append("--json")
+        _append_flags(args, _INFO_FLAGS, locals())
 
         return await self.fork(self.binary_path, args)
 
@@ -1302,50 +1116,6 @@ class AsyncCondaCmd(AsyncProcessRunner):
         if query:
             args.append(query)
             
-        # Handle search options
-        if envs:
-            args.append("--envs")
-        if info:
-            args.append("--info")
-        if subdir:
-            args.extend(["--subdir", subdir])
-        if skip_flexible_search:
-            args.append("--skip-flexible-search")
-            
-        # Handle channel options
-        if channels:
-            for channel in channels:
-                args.extend(["-c", channel])
-        if use_local:
-            args.append("--use-local")
-        if override_channels:
-            args.append("--override-channels")
-            
-        # Handle repodata options
-        if repodata_fn:
-            for fn in repodata_fn:
-                args.extend(["--repodata-fn", fn])
-        if experimental:
-            args.extend(["--experimental", experimental])
-        if no_lock:
-            args.append("--no-lock")
-        if repodata_use_zst is not None:
-            args.append("--repodata-use-zst" if repodata_use_zst else "--no-repodata-use-zst")
-            
-        # Handle networking options
-        if offline:
-            args.append("--offline")
-        if use_index_cache:
-            args.append("-C")
-        if insecure:
-            args.append("-k")
-            
-        # Handle output options
-        if verbose:
-            args.append("-v")
-        if quiet:
-            args.append("-q")
-        if as_json:
-            args.append("--json")
+        _append_flags(args, _SEARCH_FLAGS, locals())
 
         return await self.fork(self.binary_path, args)
@@ -7,9 +7,7 @@ from mcp.server.fastmcp import FastMCP
 import platform
 import psutil
 import GPUtil
-import os
-import json
-import GPUtil
+import orjson
 
 mcp = FastMCP("SystemInfo")
 
@@ -173,7 +171,7 @@ def get_system_info() -> str:
             disk["used_gb"] = bytes_to_gb(disk["used"])
             disk["free_gb"] = bytes_to_gb(disk["free"])
 
-        return json.dumps(system_info, indent=2)
+        return orjson.dumps(system_info, option=orjson.OPT_INDENT_2).decode()
 
     except Exception as e:
         return f"Error getting system information: {str(e)}"
@@ -198,7 +196,7 @@ def get_nvidia_gpu_info() -> str:
         "What's my GPU memory usage?"
         "List all GPU specifications"
     """
-    return json.dumps(_get_gpu_info(), indent=2)
+    return orjson.dumps(_get_gpu_info(), option=orjson.OPT_INDENT_2).decode()
 
 def run_sysinfo_server():
     """Entry point for the system information MCP server"""
@@ -1,11 +1,97 @@
 """Utility functions for conda command handling."""
 
+import anyio
+import asyncio
+import collections
+import contextlib
+import functools
 import os
 import platform
 import shutil
+import time
 
+# Strong references to notification tasks so they aren't collected mid-send
+_notify_tasks = set()
+
+def _notify_done(task):
+    _notify_tasks.discard(task)
+    if not task.cancelled():
+        task.exception()  # Retrieve it so a failed notification isn't logged as unhandled
+
+def notify(coro):
+    """Send an advisory MCP notification (ctx.info, ctx.report_progress) without waiting on it."""
+    task = asyncio.create_task(coro)
+    _notify_tasks.add(task)
+    task.add_done_callback(_notify_done)
+    return task
+
+@contextlib.asynccontextmanager
+async def report_errors(ctx):
+    """Send an error notification for a failed tool call and let the exception propagate.
+
+    Cancellation isn't an error: the client went away or timed out. Nor is a session
+    that closed before the notification could be sent; the tool's own exception is
+    the one raised.
+    """
+    try:
+        yield
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        with contextlib.suppress(anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await ctx.error(f"Error: {e}")
+        raise
+
+async def follow_log(ctx, runner, pid: int, timeout_seconds: float, tail_lines: int,
+                     count_lines: bool = False) -> str:
+    """Send the lines a running process writes to its log to the client until it exits,
+    and return the last tail_lines of them.
+
+    The log is polled every half second, reading only what was written since the last
+    poll. conda --json progress records become progress notifications and the other
+    lines go out as one info notification per poll. With count_lines, progress instead
+    carries the number of lines written so far, for output that has no records.
+
+    Raises:
+        TimeoutError: If the process is still running after timeout_seconds
+    """
+    # async_cmd imports this module
+    from .async_cmd import parse_progress_record, run_log_read
+
+    tail = collections.deque(maxlen=tail_lines)
+    offset = 0
+    line_count = 0
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        finished = runner.get_process(pid)['status'] != 'running'
+        text, offset = await run_log_read(runner.read_log_from, pid, offset)
+        if text:
+            lines = []
+            for line in text.splitlines():
+                record = None if count_lines else parse_progress_record(line)
+                if record is not None:
+                    await ctx.report_progress(record["progress"], record.get("maxval", 1))
+                else:
+                    lines.append(line.lstrip("\0"))
+            if lines:
+                await ctx.info("\n".join(lines))
+                tail.extend(lines)
+            if count_lines:
+                line_count += len(lines)
+                await ctx.report_progress(line_count)
+        if finished:
+            break
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Process {pid} did not complete within {timeout_seconds} seconds")
+        await asyncio.sleep(0.5)
+    return "\n".join(tail)
+
+@functools.cache
 def get_default_shell():
-    """Get the default shell path for the current system."""
+    """Get the default shell path for the current system.
+
+    Looked up once per process, like get_default_conda_binary().
+    """
     if platform.system() == "Windows":
       # Windows is not supported yet
       raise NotImplementedError("Windows is not supported yet")
@@ -22,9 +108,19 @@ def get_default_shell():
     
     raise RuntimeError("No suitable shell found")
 
+@functools.cache
 def get_default_conda_binary():
-    """Get the default conda binary path."""
-    # First try the standard PATH search
+    """Get the default conda binary path.
+
+    The lookup walks PATH and several install locations, so the result is cached
+    for the life of the process.
+    """
+    # An activated conda records its binary in CONDA_EXE, which needs just one stat
+    conda_exe = os.environ.get("CONDA_EXE")
+    if conda_exe and os.path.isfile(conda_exe):
+        return conda_exe
+
+    # Then try the standard PATH search
     conda_path = shutil.which("conda")
     if conda_path:
         # Convert condabin paths to main binary path
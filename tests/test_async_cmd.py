@@ -39,6 +39,18 @@ async def test_basic_command(runner):
     assert status.log_file and status.log_file.exists()
     assert status.log_file.parent == runner.log_dir
 
+@pytest.mark.asyncio
+async def test_execute_log_content(runner):
+    """Test that execute() writes the command output to its log file"""
+    status = await runner.execute(
+        "python",
+        ["-c", "print('line one'); print('line two')"]
+    )
+    assert status.return_code == 0
+    log_content = status.log_file.read_text()
+    assert "line one" in log_content
+    assert "line two" in log_content
+
 @pytest.mark.asyncio
 async def test_shell_command(runner):
     """Test blocking command execution with shell"""
@@ -144,6 +156,16 @@ async def test_failed_command_status(runner):
     # Verify log file exists
     assert status.log_file.exists()
 
+@pytest.mark.asyncio
+async def test_execute_failed_stderr(runner):
+    """Test that a failed execute reports its stderr"""
+    status = await runner.execute(
+        "python",
+        ["-c", "import sys; print('first', file=sys.stderr); print('second', file=sys.stderr); sys.exit(1)"]
+    )
+    assert status.return_code == 1
+    assert status.stderr == "first\nsecond\n"
+
 @pytest.mark.asyncio
 async def test_multiple_active_processes(runner):
     """Test tracking multiple processes simultaneously"""
@@ -256,6 +278,27 @@ async def test_process_cleanup(runner):
     proc_status = runner.get_process(status.pid)
     assert proc_status['status'] != 'running'
 
+@pytest.mark.asyncio
+async def test_cancel_process(runner):
+    """Test cancelling a forked process without blocking the event loop"""
+    status = await runner.fork("sleep", ["10"])
+
+    await runner.cancel_process(status.pid)
+
+    assert status.process.returncode is not None
+    with pytest.raises(ValueError):
+        await runner.cancel_process(-12345)
+
+@pytest.mark.asyncio
+async def test_wait_process(runner):
+    """Test waiting for a forked process to exit with its output logged"""
+    status = await runner.fork("echo", ["waited"])
+
+    await runner.wait_process(status)
+
+    assert runner.get_process(status.pid)['status'] == 'completed'
+    assert "waited" in runner.get_process_log(status.pid)
+
 def test_filename_sanitization(runner):
     """Test Windows filename sanitization"""
     # Test invalid characters - there are 9 invalid chars: < > : " / \ | ? *
@@ -304,3 +347,74 @@ async def test_error_stream_handling(runner):
     assert status.return_code == 0
     assert "out" in output[0]
     assert "err" in errors[0]
+
+@pytest.mark.asyncio
+async def test_get_json_response_invalid(runner):
+    """Test that non-JSON output raises ValueError"""
+    status = await runner.fork("echo", ["not json"])
+    await _wait_for_pid(runner, status.pid)
+
+    with pytest.raises(ValueError):
+        runner.get_json_response(status.pid)
+
+@pytest.mark.asyncio
+async def test_get_json_text(runner):
+    """Test JSON text passthrough for indented and compact output"""
+    # Output that is already indented is returned unchanged
+    status = await runner.fork(
+        "python",
+        ["-c", "import json; print(json.dumps({'key': 'value'}, indent=2))"]
+    )
+    await _wait_for_pid(runner, status.pid)
+    assert runner.get_json_text(status.pid) == '{\n  "key": "value"\n}\n'
+
+    # Compact output is re-serialized with indentation
+    status = await runner.fork("echo", ['{"key": "value"}'])
+    await _wait_for_pid(runner, status.pid)
+    assert runner.get_json_text(status.pid) == '{\n  "key": "value"\n}'
+
+@pytest.mark.asyncio
+async def test_read_log_from(runner):
+    """Test incremental log reads return only new complete lines"""
+    status = await runner.fork("python", ["-c", "print('one'); print('two')"])
+    await _wait_for_pid(runner, status.pid)
+    text, offset = runner.read_log_from(status.pid)
+    assert text == "one\ntwo\n"
+    assert runner.read_log_from(status.pid, offset) == ("", offset)
+
+@pytest.mark.asyncio
+async def test_read_process_log_tail(runner):
+    """Test async log reads, whole and tail"""
+    status = await runner.fork("python", ["-c", "for i in range(2000): print('line', i)"])
+    await _wait_for_pid(runner, status.pid)
+    log_content = await runner.read_process_log(status.pid)
+    assert log_content == runner.get_process_log(status.pid)
+    assert await runner.read_process_log(status.pid, tail=3) == "line 1997\nline 1998\nline 1999"
+    assert await runner.read_process_log(status.pid, tail=5000) == log_content.rstrip("\n")
+    assert await runner.read_log_tail(status.pid, 3) == ("line 1997\nline 1998\nline 1999", True)
+    assert await runner.read_log_tail(status.pid, 2000) == (log_content.rstrip("\n"), False)
+
+@pytest.mark.asyncio
+async def test_tracked_process_limit(runner, monkeypatch):
+    """Test that the oldest finished processes are evicted past the limit"""
+    monkeypatch.setattr("condamcp.async_cmd.MAX_TRACKED_PROCESSES", 2)
+    pids = []
+    for i in range(3):
+        status = await runner.fork("echo", [str(i)])
+        await _wait_for_pid(runner, status.pid)
+        pids.append(status.pid)
+    assert list(runner.get_active_processes()) == pids[1:]
+
+@pytest.mark.asyncio
+async def test_get_json_response_with_progress(runner):
+    """Test that conda --json progress records ahead of the result are skipped"""
+    script = (
+        "import sys; "
+        "sys.stdout.write('{\"fetch\":\"pkg\",\"finished\":false,\"maxval\":1,\"progress\":0.5}\\n\\0'); "
+        "sys.stdout.write('{\"fetch\":\"pkg\",\"finished\":true,\"maxval\":1,\"progress\":1}\\n\\0'); "
+        "sys.stdout.write('{\\n  \"success\": true\\n}\\n')"
+    )
+    status = await runner.fork("python", ["-c", script])
+    await _wait_for_pid(runner, status.pid)
+    assert runner.get_json_response(status.pid) == {"success": True}
+    assert runner.get_json_text(status.pid) == '{\n  "success": true\n}\n'
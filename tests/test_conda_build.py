@@ -20,7 +20,7 @@ from pathlib import Path
 import time
 import logging
 from typing import AsyncIterator
-from condamcp.condabuild import AsyncCondaBuild
+from condamcp.condabuild import AsyncCondaBuild, CondaBuildSpec, _apply_fast_build, _PACKAGE_PATH_RE
 from condamcp.async_cmd import ProcessStatus
 
 # Local paths for testing
@@ -124,7 +124,7 @@ async def test_conda_build_process(conda_build, caplog):
         if build_status['return_code'] is not None:
             logger.error("Build failed immediately!")
             # Get log content
-            log_content = conda_build.get_build_log(build_id)
+            log_content = await conda_build.get_build_log(build_id)
             if log_content != "Build ID not found":
                 logger.info(f"Log content:\n{log_content}")
 
@@ -143,7 +143,7 @@ async def test_conda_build_process(conda_build, caplog):
                 
                 # If status changed to completed/failed, print logs
                 if build_status['status'] in ['completed', 'failed']:
-                    log_content = conda_build.get_build_log(build_id)
+                    log_content = await conda_build.get_build_log(build_id)
                     logger.info(f"Build log:\n{log_content}")
             
             if build_status['status'] in ['completed', 'failed']:
@@ -156,7 +156,7 @@ async def test_conda_build_process(conda_build, caplog):
         
         # Get final status and logs
         final_status = await conda_build.check_build_status(build_id)
-        log_content = conda_build.get_build_log(build_id)
+        log_content = await conda_build.get_build_log(build_id)
         
         logger.info(f"Final build status: {final_status}")
         logger.info(f"Final log content:\n{log_content}")
@@ -168,4 +168,52 @@ async def test_conda_build_process(conda_build, caplog):
         
     except Exception as e:
         logger.error(f"Test failed with error: {e}")
-        raise
\ No newline at end of file
+        raise
+
+def test_fast_build_keeps_explicit_options():
+    """Test that fast_build only fills in options the caller didn't give"""
+    spec = _apply_fast_build(CondaBuildSpec(
+        recipe_path="recipe", build_env="build", fast_build=True, zstd_compression_level=0
+    ))
+    assert spec.zstd_compression_level == 0
+    assert spec.no_test and spec.no_verify
+
+    spec = _apply_fast_build(CondaBuildSpec(
+        recipe_path="recipe", build_env="build", fast_build=True, test=True
+    ))
+    assert spec.zstd_compression_level == 1
+    assert not spec.no_test
+
+@pytest.mark.asyncio
+async def test_read_process_log_cache():
+    """Test that build log reads only decode what was appended since the last read."""
+    builder = AsyncCondaBuild(track_processes=True)
+    status = await builder.fork("python", ["-c", "print('line 1')"])
+    await builder.wait_process(status)
+    assert await builder.read_process_log(status.pid) == "line 1\n"
+
+    # Append a character split across two writes, reading in between
+    char = "é".encode()
+    with open(status.log_file, "ab") as f:
+        f.write(b"line 2 " + char[:1])
+    assert (await builder.read_process_log(status.pid)).startswith("line 1\nline 2 ")
+    with open(status.log_file, "ab") as f:
+        f.write(char[1:] + b"\n")
+    assert await builder.read_process_log(status.pid) == "line 1\nline 2 é\n"
+    assert await builder.read_process_log(status.pid) == builder.get_process_log(status.pid)
+
+def test_build_result_cache_paths(tmp_path):
+    """Test that a dangling symlink doesn't stop the recipe fingerprint and that package
+    paths are found in POSIX and Windows build logs."""
+    (tmp_path / "meta.yaml").write_text("package: {name: test}")
+    (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+    assert AsyncCondaBuild._build_fingerprint(str(tmp_path), None, ["build"], None)
+
+    log = (
+        b"anaconda upload \\\n    /opt/conda/conda-bld/linux-64/test-1.0-0.conda\n"
+        b"anaconda upload ^\r\n    C:\\conda-bld\\win-64\\test-1.0-0.tar.bz2\r\n"
+    )
+    assert _PACKAGE_PATH_RE.findall(log) == [
+        b"/opt/conda/conda-bld/linux-64/test-1.0-0.conda",
+        b"C:\\conda-bld\\win-64\\test-1.0-0.tar.bz2",
+    ]
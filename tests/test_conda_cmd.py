@@ -50,6 +50,13 @@ async def test_conda_env_list(conda):
     json_output = conda.get_json_response(status.pid)
     assert isinstance(json_output, dict)
 
+@pytest.mark.asyncio
+async def test_conda_env_unknown_command(conda):
+    """Test that an unknown conda env subcommand is rejected without running conda."""
+    with pytest.raises(ValueError, match="Unknown conda env command"):
+        await conda.env("nonexistent")
+    assert not conda.get_active_processes()
+
 @pytest.mark.asyncio
 async def test_conda_env_export(conda):
     """Test conda env export command."""